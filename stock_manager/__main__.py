@@ -4,15 +4,10 @@ Main entry point for the SLAC Inventory Management Application.
 Initializes the Qt Application and launches the main application window.
 """
 
-import asyncio
 import logging
 import sys
 
-from PyQt5.QtWidgets import QApplication, QMessageBox
-from qasync import QEventLoop
-
 import stock_manager
-from stock_manager.app import App
 from stock_manager.cli import build_commands
 
 
@@ -27,8 +22,9 @@ def main() -> None:
     `app.log`, displays a fatal error dialog, and exits.
 
     If CLI mode completes successfully or doesn't require GUI,
-    the Qt application is never run. If GUI mode is selected,
-    initializes the Qt application and runs the main event loop.
+    the Qt application is never run (and the GUI stack is never
+    imported). If GUI mode is selected, initializes the Qt
+    application and runs the main event loop.
 
     :raise SystemExit: If a fatal error occurs during GUI startup.
     """
@@ -41,10 +37,17 @@ def main() -> None:
     if not args:
         return
 
-    if hasattr(args, 'func'):
+    if args.func:
         args.func(args)
         return
 
+    import asyncio
+
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+    from qasync import QEventLoop
+
+    from stock_manager.app import App
+
     try:
         app = QApplication(sys.argv)
         loop = QEventLoop(app)
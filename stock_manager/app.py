@@ -5,18 +5,20 @@ the SLAC Inventory Management application.
 
 import asyncio
 import logging
-from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from PyQt5.QtGui import QCloseEvent, QFont
 from PyQt5.QtWidgets import (QMainWindow, QMessageBox, QPushButton,
-                             QStackedWidget)
+                             QStackedWidget, QWidget)
 from PyQt5.uic import loadUi
 from qasync import asyncSlot
 
 import stock_manager
 from stock_manager.controllers import AbstractController
 
+if TYPE_CHECKING:
+    from stock_manager.controllers import Add
+
 
 class App(QMainWindow):
     """
@@ -35,7 +37,7 @@ class App(QMainWindow):
         :raises SystemExit: If the main UI fails to load
         """
 
-        from stock_manager.controllers import (Add, Edit, Export, Finish,
+        from stock_manager.controllers import (Edit, Export, Finish,
                                                ItemScanner, Login, QRGenerate,
                                                Remove, View)
         from stock_manager.utils import DBUtils, ExportUtils
@@ -49,7 +51,8 @@ class App(QMainWindow):
         self.login = Login(self)
         self.view = View(self)
         self.scanner = ItemScanner(self)
-        self.add = Add(self)
+        # built on first use, see `add`
+        self._add: Union['Add', None] = None
         self.edit = Edit(self)
         self.remove = Remove(self)
         self.generate = QRGenerate(self)
@@ -58,21 +61,20 @@ class App(QMainWindow):
 
         self.controllers: list[AbstractController] = [
             self.view, self.scanner,
-            self.add, self.edit, self.remove,
+            self.edit, self.remove,
             self.generate, self.login,
             self.export, self.finish
         ]
 
         self.user = ''
         self.all_items: list[stock_manager.model.Item] = []
+        # `all_items` keyed by part number, for constant time lookups
+        self.items_by_part_num: dict[str, stock_manager.model.Item] = {}
         self.screens: Union[QStackedWidget, None] = None
         self.current_page: Union[stock_manager.utils.Pages, None] = None
 
         try:
-            ui_path: Path = Path(
-                __file__
-            ).resolve().parent.parent / 'ui' / 'main.ui'
-            loadUi(str(ui_path), self)
+            loadUi(str(stock_manager.utils.UI_DIR / 'main.ui'), self)
         except Exception as e:
             self.logger.error(f'Failed To Load Main UI File: {e}')
             QMessageBox.critical(
@@ -94,6 +96,10 @@ class App(QMainWindow):
 
         for screen in self.controllers:
             self.screens.addWidget(screen)
+        # holds the Add page's place in the stack until it is built
+        self.screens.insertWidget(
+            stock_manager.utils.Pages.ADD.value.PAGE_INDEX, QWidget()
+        )
 
         self.handle_connections()
 
@@ -104,18 +110,22 @@ class App(QMainWindow):
         to a controllers `to_page()` method.
         """
 
+        page_openers = [controller.to_page for controller in self.controllers]
+        page_openers.insert(
+            stock_manager.utils.Pages.ADD.value.PAGE_INDEX, self._open_add
+        )
+
         button: QPushButton
-        controller: AbstractController
         enum: stock_manager.utils.Pages
-        for button, controller, enum in zip(
+        for button, to_page, enum in zip(
                 self.buttons,
-                self.controllers,
+                page_openers,
                 stock_manager.utils.Pages
         ):
             if not isinstance(button, QPushButton):
                 continue
 
-            button.clicked.connect(controller.to_page)
+            button.clicked.connect(to_page)
             button.setShortcut(str(enum.value.PAGE_INDEX + 1))
 
         self.screens.currentChanged.connect(self._on_page_changed)
@@ -152,6 +162,33 @@ class App(QMainWindow):
 
         handle_icons()
 
+    @property
+    def add(self) -> 'Add':
+        """
+        The Add page, built in place of its placeholder the first time
+        it is needed so startup does not pay for a page that may never
+        be opened.
+
+        :return: The Add page controller.
+        """
+
+        if self._add is None:
+            from stock_manager.controllers import Add
+
+            index = stock_manager.utils.Pages.ADD.value.PAGE_INDEX
+            placeholder = self.screens.widget(index)
+            self._add = Add(self)
+            self.controllers.append(self._add)
+            self.screens.insertWidget(index, self._add)
+            self.screens.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return self._add
+
+    def _open_add(self) -> None:
+        """Navigates to the Add page, building it if needed."""
+
+        self.add.to_page()
+
     def run(self) -> None:
         """
         Start the application workflow.
@@ -181,6 +218,9 @@ class App(QMainWindow):
             self.all_items = self.db.create_all_items(
                 self.db.get_all_data_gs()
             )
+            self.items_by_part_num = {
+                item.part_num: item for item in self.all_items
+            }
             await self.update_tables()
         except Exception as e:
             self.logger.error(f'Error Loading Data Asynchronously: {e}')
@@ -258,7 +298,7 @@ class App(QMainWindow):
                 controller.update_table()
                 for controller in self.controllers
                 if isinstance(controller, AbstractController)
-                and hasattr(controller, 'table')
+                and controller._has_table
             )
         )
 
@@ -292,7 +332,7 @@ class App(QMainWindow):
         if not self.user:
             return
 
-        controller = self.controllers[self.current_page.value.PAGE_INDEX]
+        controller = self.screens.widget(self.current_page.value.PAGE_INDEX)
         if hasattr(controller, 'search'):
             controller.search.setFocus()
             return
@@ -7,21 +7,48 @@ across the application without needing a GUI.
 """
 
 import argparse
+import functools
+import io
 import logging
+import operator
 import os
 import sys
-from typing import Union
-
-import pytest
-from prettytable import PrettyTable
+from typing import TYPE_CHECKING, Union
 
 import stock_manager
-from stock_manager.model import Item
-from stock_manager.utils import (DatabaseUpdateType, DBUtils, ExportUtils,
-                                 StockStatus)
+
+if TYPE_CHECKING:
+    from stock_manager.utils import DBUtils, ExportUtils
 
 logger = logging.getLogger()
 
+# Top-level `store_true` flags as (short, long, help).
+_FLAGS = (
+    ('-r', '--run',
+     'Runs Application GUI, Same As Running "python -m stock_manager"'),
+    ('-t', '--tree',
+     'Prints stock_manager\'s commands, subcommands, '
+     'and positional arguments in tree layout'),
+)
+
+# Flags that print a listing of every subcommand.
+_FULL_LISTING_FLAGS = frozenset({'-h', '--help', '-t', '--tree'})
+
+# Google Sheet columns shown in the items report, in column order.
+_ITEM_ROW_KEYS = operator.itemgetter(
+    'Part #', 'Manufacturer', 'Total', 'B750', 'B757', 'Minimum',
+    'Min Sallies', 'Excess', 'Stock Status', 'Description'
+)
+
+# Report table layouts.
+_ITEM_HEADERS = (
+    '#', 'Name', 'Manufacturer', 'Total',
+    'B750 Stock', 'B757 Stock', 'B750 Min',
+    'B757 Min', 'Excess', 'Status', 'Description'
+)
+_ITEM_MAX_WIDTHS = {'Name': 14, 'Description': 80}
+_USER_HEADERS = ('#', 'Username')
+
 
 def build_commands() -> Union[argparse.Namespace, None]:
     """
@@ -30,6 +57,11 @@ def build_commands() -> Union[argparse.Namespace, None]:
     :return: Parsed command-line arguments including flags and values.
     """
 
+    # `-v` on its own needs no parser, answer it the way argparse would
+    if sys.argv[1:] in (['-v'], ['--version']):
+        sys.stdout.write(f'{stock_manager.__version__}\n')
+        raise SystemExit(0)
+
     top_parser = argparse.ArgumentParser(
         prog='stock_manager',
         description='Common Stock Manager CLI'
@@ -37,23 +69,50 @@ def build_commands() -> Union[argparse.Namespace, None]:
     sub_parsers = top_parser.add_subparsers(help='Available Subcommands')
 
     # region Top-Level Arguments
-    top_parser.add_argument(
-        '-r', '--run',
-        action='store_true',
-        help='Runs Application GUI, Same As Running "python -m stock_manager"'
-    )
-    top_parser.add_argument(
+    add_argument = top_parser.add_argument
+    for short_flag, long_flag, help_text in _FLAGS:
+        add_argument(
+            short_flag, long_flag,
+            action='store_true',
+            help=help_text
+        )
+    add_argument(
         '-v', '--version',
         action='version',
         version=stock_manager.__version__,
         help='Prints stock_manager\'s git version'
     )
-    top_parser.add_argument(
-        '-t', '--tree',
-        action='store_true',
-        help='Prints stock_manager\'s commands, subcommands, '
-             'and positional arguments in tree layout',
-    )
+    # subcommands override this with their handler
+    top_parser.set_defaults(func=None)
+    # endregion
+
+    # Only the requested subcommand is built; help, the command tree and
+    # unknown commands need every subcommand registered.
+    argv = sys.argv[1:]
+    requested = next((arg for arg in argv if not arg.startswith('-')), None)
+    full_listing = not _FULL_LISTING_FLAGS.isdisjoint(argv)
+    if requested in _SUBCOMMANDS and not full_listing:
+        _SUBCOMMANDS[requested](sub_parsers)
+    else:
+        for add_subcommand in _SUBCOMMANDS.values():
+            add_subcommand(sub_parsers)
+
+    args = top_parser.parse_args()
+
+    if args.tree:
+        print_command_tree(top_parser)
+        raise SystemExit(1)
+
+    return args
+
+
+# region Subcommand Builders
+def _add_test_parser(sub_parsers: argparse._SubParsersAction) -> None:
+    """
+    Registers the `test` subcommand.
+
+    :param sub_parsers: Top-level subparsers to register with.
+    """
 
     test_parser = sub_parsers.add_parser(
         'test',
@@ -61,6 +120,14 @@ def build_commands() -> Union[argparse.Namespace, None]:
     )
     test_parser.set_defaults(func=_run_tests)
 
+
+def _add_sync_parser(sub_parsers: argparse._SubParsersAction) -> None:
+    """
+    Registers the `sync` subcommand.
+
+    :param sub_parsers: Top-level subparsers to register with.
+    """
+
     sync_parser = sub_parsers.add_parser(
         'sync',
         help='Synchronize Both Databases, '
@@ -69,9 +136,15 @@ def build_commands() -> Union[argparse.Namespace, None]:
              '(Only Run If A Database Is Changed Externally)'
     )
     sync_parser.set_defaults(func=_run_sync_databases)
-    # endregion
 
-    # region Export Arguments
+
+def _add_export_parser(sub_parsers: argparse._SubParsersAction) -> None:
+    """
+    Registers the `export` subcommand and its arguments.
+
+    :param sub_parsers: Top-level subparsers to register with.
+    """
+
     export_parser = sub_parsers.add_parser(
         'export',
         help='Exports All Item Data To A Specified File Type And Location '
@@ -90,9 +163,15 @@ def build_commands() -> Union[argparse.Namespace, None]:
         help='Path To Export The File To (Default Path: ./exports)'
     )
     export_parser.set_defaults(func=_run_export)
-    # endregion
 
-    # region QR Arguments
+
+def _add_qr_parser(sub_parsers: argparse._SubParsersAction) -> None:
+    """
+    Registers the `qr` subcommand and its arguments.
+
+    :param sub_parsers: Top-level subparsers to register with.
+    """
+
     qr_parser = sub_parsers.add_parser(
         'qr',
         help='Generates A QR Code Of A Specified Item And Stores It As A '
@@ -113,9 +192,15 @@ def build_commands() -> Union[argparse.Namespace, None]:
              '(Default Path: ./exports)'
     )
     qr_parser.set_defaults(func=_run_qr)
-    # endregion
 
-    # region Item Arguments
+
+def _add_items_parser(sub_parsers: argparse._SubParsersAction) -> None:
+    """
+    Registers the `items` subcommand and its nested commands.
+
+    :param sub_parsers: Top-level subparsers to register with.
+    """
+
     item_parser = sub_parsers.add_parser(
         'items',
         help='Commands Related To Item Management '
@@ -144,13 +229,13 @@ def build_commands() -> Union[argparse.Namespace, None]:
 
     add_parser = item_subparser.add_parser(
         'add',
-        help='Add An Item With Specified Values To Both Databases '
-             '(Used With Sequence Of 10 Item Detail Arguments)'
+        help='Add One Or More Items With Specified Values To Both Databases '
+             '(Used With Sequences Of 10 Item Detail Arguments)'
     )
     add_parser.add_argument(
         'values',
-        nargs=10,
-        help='10 Values Representing The Item Fields In Order '
+        nargs='+',
+        help='10 Values Per Item Representing The Item Fields In Order '
              '(e.g., part_num, manufacturer, total, etc.)'
     )
     add_parser.set_defaults(func=_run_add_item)
@@ -182,9 +267,15 @@ def build_commands() -> Union[argparse.Namespace, None]:
              '(e.g., part_num=sample_item, total=0, etc.)'
     )
     edit_parser.set_defaults(func=_run_edit_item)
-    # endregion
 
-    # region User Arguments
+
+def _add_users_parser(sub_parsers: argparse._SubParsersAction) -> None:
+    """
+    Registers the `users` subcommand and its nested commands.
+
+    :param sub_parsers: Top-level subparsers to register with.
+    """
+
     user_parser = sub_parsers.add_parser(
         'users',
         help='Commands Related To User Management '
@@ -232,50 +323,93 @@ def build_commands() -> Union[argparse.Namespace, None]:
         help='Username To Remove From Databases'
     )
     remove_parser.set_defaults(func=_run_remove_user)
-    # endregion
 
-    args = top_parser.parse_args()
 
-    if args.tree:
-        print_command_tree(top_parser)
-        raise SystemExit(1)
+# Subcommand name -> builder, in the order they are listed in help.
+_SUBCOMMANDS = {
+    'test': _add_test_parser,
+    'sync': _add_sync_parser,
+    'export': _add_export_parser,
+    'qr': _add_qr_parser,
+    'items': _add_items_parser,
+    'users': _add_users_parser,
+}
 
-    return args
+
+# endregion
 
 
 # region Misc Argument Functions
-def print_command_tree(parser: argparse.ArgumentParser, indent=1):
+def print_command_tree(parser: argparse.ArgumentParser) -> None:
+    """
+    Prints every command, subcommand and argument of `parser`
+    as a tree, written to stdout in a single call.
+
+    :param parser: The top-level parser to print.
+    """
+
+    buffer = io.StringIO()
+    _write_command_tree(parser, buffer)
+    sys.stdout.write(buffer.getvalue())
+
+
+def _write_command_tree(
+    parser: argparse.ArgumentParser,
+    buffer: io.StringIO,
+    indent=1
+) -> None:
+    """
+    Recursively writes the tree lines of `parser` into `buffer`.
+
+    :param parser: The parser whose actions are written.
+    :param buffer: The buffer collecting the tree output.
+    :param indent: Tree depth of `parser`'s actions.
+    """
+
+    prefix = f'{"│   " * (indent - 1)}├── '
     for action in parser._actions:
         if not isinstance(action, argparse.Action):
             continue
 
         if not hasattr(action, '_choices_actions'):
-            print(f'{"│   " * (indent - 1)}├── {action.dest} - {action.help}')
+            buffer.write(f'{prefix}{action.dest} - {action.help}\n')
             continue
 
-        for i, choice_action in enumerate(action._choices_actions):
+        for choice_action in action._choices_actions:
             subparser_name = choice_action.dest
             help_text = choice_action.help
-            print(f'{"│   " * (indent - 1)}├── {subparser_name} - {help_text}')
+            buffer.write(f'{prefix}{subparser_name} - {help_text}\n')
 
             subparser = action.choices[subparser_name]
-            print_command_tree(subparser, indent + 1)
+            _write_command_tree(subparser, buffer, indent + 1)
 
 
 def _run_tests(args) -> None:
     """
     Handler for the `test` command --- runs pytest on the `tests/` directory.
 
+    On POSIX, pytest is run in place of the current process, so the CLI
+    itself never imports it. Elsewhere (exec spawns a detached child on
+    Windows) pytest is run in-process instead.
+
     :param args: Empty CLI arguments.
-    :return: Exits after completion.
+    :return: Exits with pytest's return code.
     """
 
     logger.info('Starting Tests...')
 
     tests_path = os.path.join(os.path.dirname(__file__), 'tests')
-    return_code = pytest.main([tests_path])
 
-    sys.exit(return_code)
+    if os.name == 'posix':
+        # exec does not flush Python-level buffers, so
+        # pending log records and output are written first
+        logging.shutdown()
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable, '-m', 'pytest', tests_path])
+
+    import pytest
+
+    sys.exit(pytest.main([tests_path]))
 
 
 def _run_export(args) -> bool:
@@ -287,22 +421,24 @@ def _run_export(args) -> bool:
     :return: `True` if operation is completed successfully, `False` otherwise.
     """
 
+    from stock_manager.utils import DBUtils
+
     path = args.path
     extension = args.extension
+    if extension not in ('csv', 'psv', 'tsv', 'pdf'):
+        logger.warning(f'Unknown Export Type: {extension}')
+        return False
+
     logger.info(f'Exporting Data As .{extension} File...')
 
-    utils = ExportUtils()
-    db = DBUtils()
-    all_items = db.create_all_items(db.get_all_data_gs())
+    utils = _export()
+    all_items = DBUtils.create_all_items(_get_all_data())
 
     match extension:
         case 'csv' | 'psv' | 'tsv':
             utils.sv_export(extension, path, all_items)
         case 'pdf':
             utils.pdf_export()
-        case _:
-            logger.warning(f'Unknown Export Type: {extension}')
-            return False
 
     logger.info(f'Successfully Exported Data To .{extension} File')
     return True
@@ -320,7 +456,7 @@ def _run_qr(args) -> bool:
     path = args.path
     part_num = args.part_num
     logger.info(f'Exporting {part_num} QR Code As .PNG...')
-    utils = ExportUtils()
+    utils = _export()
 
     image = utils.create_code(part_num)
     if not image:
@@ -343,7 +479,7 @@ def _run_sync_databases(args) -> bool:
     """
 
     logger.info('Syncing Databases...')
-    utils = DBUtils()
+    utils = _db()
     if not utils.sql_database:
         logger.info('No MySQL Database Present, '
                     'No Need For Database Synchronization')
@@ -355,6 +491,48 @@ def _run_sync_databases(args) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _db() -> 'DBUtils':
+    """
+    Returns the process-wide `DBUtils` instance, connecting to
+    Google Sheets and MySQL on first use only.
+
+    :return: A shared `DBUtils` object.
+    """
+
+    from stock_manager.utils import DBUtils
+
+    return DBUtils()
+
+
+@functools.lru_cache(maxsize=1)
+def _export() -> 'ExportUtils':
+    """
+    Returns the process-wide `ExportUtils` instance.
+
+    :return: A shared `ExportUtils` object.
+    """
+
+    from stock_manager.utils import ExportUtils
+
+    return ExportUtils()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_all_data() -> list[dict[str, Union[int, str, None]]]:
+    """
+    Fetches every item row from the Google Sheet once per process,
+    shared by the commands that read the full inventory.
+
+    Item writes call `_get_all_data.cache_clear()` so later
+    reads in the same process see the change.
+
+    :return: List of dictionaries, each representing a row from the sheet.
+    """
+
+    return _db().get_all_data_gs()
+
+
 # endregion
 
 
@@ -396,30 +574,55 @@ def _run_search_items(args) -> bool:
 def _run_add_item(args) -> bool:
     """
     Handler for the `...item add...` command
-    --- adds a new item to the database.
+    --- adds one or more new items to the database in a single batch.
 
-    :param args: CLI arguments with 10 values representing
+    :param args: CLI arguments with 10 values per item representing
     item detail in the Google Sheet's order.
     :return: `True` if operation is completed successfully, `False` otherwise.
     """
 
-    logger.info(f'Adding "{args.values[0]}" To Databases...')
+    from stock_manager.model import Item
+    from stock_manager.utils import DatabaseUpdateType
 
-    try:
-        vals: list[Union[str, int]] = [
-            value if i not in [3, 4, 5, 6, 7, 8]
-            else int(value)
-            for i, value in enumerate(args.values)
-        ]
-        item = Item(*vals)
+    values = args.values
+    if len(values) % 10:
+        logger.error(f'Expected 10 Values Per Item, Got {len(values)}')
+        return False
 
-        utils = DBUtils()
-        if utils.find_item(item.part_num):
-            raise Exception(f'"{item.part_num}" Already In Items Databases.')
+    part_nums = [values[i] for i in range(0, len(values), 10)]
+    logger.info(f'Adding "{", ".join(part_nums)}" To Databases...')
 
-        utils.update_items_database(DatabaseUpdateType.ADD, item)
+    try:
+        items: list[Item] = []
+        for i in range(0, len(values), 10):
+            vals: list[Union[str, int]] = [
+                *values[i:i + 3],
+                *map(int, values[i + 3:i + 9]),
+                values[i + 9]
+            ]
+            items.append(Item(*vals))
+
+        existing = {str(data['Part #']) for data in _get_all_data()}
+        seen: set[str] = set()
+        for item in items:
+            if item.part_num in existing:
+                raise Exception(
+                    f'"{item.part_num}" Already In Items Databases.'
+                )
+            if item.part_num in seen:
+                raise Exception(f'"{item.part_num}" Given More Than Once.')
+            seen.add(item.part_num)
+
+        if not _db().update_items_database(
+                DatabaseUpdateType.ADD,
+                items
+        ):
+            return False
+        _get_all_data.cache_clear()
 
-        logger.info(f'Successfully Added "{item.part_num}" To Items Databases')
+        logger.info(
+            f'Successfully Added "{", ".join(part_nums)}" To Items Databases'
+        )
         return True
     except Exception as e:
         logger.error(f'Failed To Add Item To Items Database: {e}')
@@ -435,9 +638,11 @@ def _run_remove_item(args) -> bool:
     :return: `True` if operation is completed successfully, `False` otherwise.
     """
 
+    from stock_manager.utils import DatabaseUpdateType
+
     logger.info(f'Removing "{args.part_num}" From Databases...')
 
-    utils = DBUtils()
+    utils = _db()
     item = utils.find_item(args.part_num)
     if not item:
         logger.error(f'Could Not Locate "{args.part_num}" In Databases')
@@ -445,6 +650,7 @@ def _run_remove_item(args) -> bool:
 
     if not utils.update_items_database(DatabaseUpdateType.REMOVE, item):
         return False
+    _get_all_data.cache_clear()
 
     logger.info(f'Successfully Removed {item.part_num} From Databases')
     return True
@@ -461,25 +667,33 @@ def _run_edit_item(args) -> bool:
     :return: `True` if operation is completed successfully, `False` otherwise.
     """
 
+    from stock_manager.model import Item
+    from stock_manager.utils import DatabaseUpdateType
+
+    change_vals_dict: dict[str, str] = {}
+    value: str
+    for value in args.values:
+        key, sep, new_value = value.partition('=')
+        if not sep or key not in Item.__dataclass_fields__:
+            logger.error(f'Invalid Field Change "{value}", '
+                         f'Expected <field>=<value>')
+            return False
+        change_vals_dict[key] = new_value
+
     logger.info(f'Editing {args.part_num} In Databases...')
 
-    utils = DBUtils()
+    utils = _db()
     item = utils.find_item(args.part_num)
     if not item:
         logger.error(f'Could Not Locate "{args.part_num}" In Databases')
         return False
 
-    change_vals_dict: dict[str, str] = {}
-    value: str
-    for value in args.values:
-        split_arg: list[str, str] = value.split('=')
-        change_vals_dict[split_arg[0]] = split_arg[1]
-
     for key, value in change_vals_dict.items():
         item[key] = value
 
     if not utils.update_items_database(DatabaseUpdateType.EDIT, item):
         return False
+    _get_all_data.cache_clear()
 
     logger.info(f'Successfully Updated {item.part_num}\'s Values In Databases')
     return True
@@ -532,9 +746,11 @@ def _run_add_user(args) -> bool:
     :return: `True` if operation is completed successfully, `False` otherwise.
     """
 
+    from stock_manager.utils import DatabaseUpdateType
+
     logger.info('Adding User To Databases...')
 
-    utils = DBUtils()
+    utils = _db()
     username_arg = args.username
     if username_arg in utils.get_all_users_gs():
         logger.warning(f'"{username_arg}" Already In Users Databases')
@@ -556,10 +772,12 @@ def _run_remove_user(args) -> bool:
     :return: `True` if operation is completed successfully, `False` otherwise.
     """
 
+    from stock_manager.utils import DatabaseUpdateType
+
     logger.info('Removing User From Databases...')
 
     username_arg = args.username
-    if not DBUtils().update_users_database(
+    if not _db().update_users_database(
             DatabaseUpdateType.REMOVE,
             username_arg
     ):
@@ -581,69 +799,66 @@ def _list_items(search_value='') -> None:
     :param search_value: Optional substring to filter items.
     """
 
+    from prettytable import PrettyTable
+
+    from stock_manager.utils import StockStatus
+
     logger.info(
         'Gathering Item Data...'
         if not search_value
         else f'Searching For Items With "{search_value}"...'
     )
 
-    all_data: list[dict[str, Union[int, str, None]]] = \
-        DBUtils().get_all_data_gs()
-    headers = [
-        '#', 'Name', 'Manufacturer', 'Total',
-        'B750 Stock', 'B757 Stock', 'B750 Min',
-        'B757 Min', 'Excess', 'Status', 'Description'
-    ]
-    table = PrettyTable(headers)
-    table._max_width = {'Name': 14, 'Description': 80}
+    all_data: list[dict[str, Union[int, str, None]]] = _get_all_data()
+    table = PrettyTable(_ITEM_HEADERS)
+    table._max_width = dict(_ITEM_MAX_WIDTHS)
     table.align['Description'] = 'l'
 
-    print('\n[+] Stock Items Report')
-
     i: int
     data: dict[str, Union[int, str, None]]
-    out_of_stock = low_stock = in_stock = other = total = 0
+    status_counts: dict[str, int] = {
+        status.value: 0 for status in StockStatus
+    }
+    other = 0
+    rows: list[list[Union[int, str, None]]] = []
+    needle = search_value.casefold()
+    # an int's text is only digits and '-', other needles can skip ints
+    search_ints = not needle.strip('-0123456789')
+    fold_cache: dict[str, str] = {}
+
+    def fold(text: str) -> str:
+        folded = fold_cache.get(text)
+        if folded is None:
+            folded = fold_cache[text] = text.casefold()
+        return folded
+
     for i, data in enumerate(all_data):
-        if search_value:
-            found = False
-            for value in data.values():
-                value = str(value)
-                if search_value.lower() in value.lower():
-                    found = True
-                    break
-            if not found:
-                continue
-
-        row = [
-            i + 1,
-            data['Part #'],
-            data['Manufacturer'],
-            data['Total'],
-            data['B750'],
-            data['B757'],
-            data['Minimum'],
-            data['Min Sallies'],
-            data['Excess'],
-            data['Stock Status'],
-            data['Description']
-        ]
-        match data['Stock Status']:
-            case StockStatus.OUT_OF_STOCK.value:
-                out_of_stock += 1
-            case StockStatus.LOW_STOCK.value:
-                low_stock += 1
-            case StockStatus.IN_STOCK.value:
-                in_stock += 1
-            case _:
-                other += 1
-        total += 1
-        table.add_row(row)
-
-    print(table)
-    print(
-        '[*] Total Items:', total, '| Out Of Stock:', out_of_stock,
-        '| Low Stock:', low_stock, '| In Stock:', in_stock, '| Other:',
-        other
+        # Fields are joined with a unit separator so a match
+        # cannot span the boundary between two fields.
+        if needle and needle not in '\x1f'.join(
+            fold(str(value))
+            for value in data.values()
+            if search_ints or not isinstance(value, int)
+        ):
+            continue
+
+        rows.append([i + 1, *_ITEM_ROW_KEYS(data)])
+        status = data['Stock Status']
+        if status in status_counts:
+            status_counts[status] += 1
+        else:
+            other += 1
+    table.add_rows(rows)
+
+    total = len(rows)
+    out_of_stock = status_counts[StockStatus.OUT_OF_STOCK.value]
+    low_stock = status_counts[StockStatus.LOW_STOCK.value]
+    in_stock = status_counts[StockStatus.IN_STOCK.value]
+
+    sys.stdout.write(
+        f'\n[+] Stock Items Report\n{table}\n'
+        f'[*] Total Items: {total} | Out Of Stock: {out_of_stock} '
+        f'| Low Stock: {low_stock} | In Stock: {in_stock} | Other: {other}\n'
     )
     logger.info('Successfully Printed Items')
 
@@ -656,26 +871,29 @@ def _list_users(search_value='') -> None:
     :param search_value: Optional username substring to filter users.
     """
 
+    from prettytable import PrettyTable
+
     logger.info(
         'Gathering User Data...'
         if not search_value
         else f'Searching For Usernames With "{search_value}"...'
     )
-    all_users: set[str] = DBUtils().get_all_users_gs()
-    table = PrettyTable(['#', 'Username'])
-
-    print('\n[+] Users Report')
+    all_users: list[str] = sorted(_db().get_all_users_gs())
+    table = PrettyTable(_USER_HEADERS)
 
     i: int
     username: str
-    total = 0
+    rows: list[list[Union[int, str]]] = []
+    needle = search_value.lower()
     for i, username in enumerate(all_users):
-        if search_value and search_value.lower() not in username.lower():
+        if needle and needle not in username.lower():
             continue
-        total += 1
-        table.add_row([i + 1, username])
+        rows.append([i + 1, username])
+    table.add_rows(rows)
+    total = len(rows)
 
-    print(table)
-    print('[*] Total Users:', total)
+    sys.stdout.write(
+        f'\n[+] Users Report\n{table}\n[*] Total Users: {total}\n'
+    )
     logger.info('Successfully Printed Users')
 # endregion
@@ -1,13 +1,11 @@
-"""Controllers package for the Stock Management Application."""
+"""
+Controllers package for the Stock Management Application.
 
-from .abstract import AbstractController, AbstractExporter, AbstractScanner
-from .add import Add
-from .edit import Edit
-from .export import Export, QRGenerate
-from .finish import Finish
-from .remove import Remove
-from .scanner import ItemScanner, Login
-from .view import View
+Controllers are imported on first access so that importing the
+package does not load every page (and its Qt/export dependencies).
+"""
+
+import importlib
 
 __all__ = [
     'AbstractController',
@@ -23,3 +21,50 @@ __all__ = [
     'Remove',
     'QRGenerate'
 ]
+
+# Exported name -> submodule that defines it.
+_LAZY = {
+    'AbstractController': 'abstract',
+    'AbstractScanner': 'abstract',
+    'AbstractExporter': 'abstract',
+    'Login': 'scanner',
+    'View': 'view',
+    'ItemScanner': 'scanner',
+    'Finish': 'finish',
+    'Export': 'export',
+    'Add': 'add',
+    'Edit': 'edit',
+    'Remove': 'remove',
+    'QRGenerate': 'export'
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports and caches a controller the first time it is accessed.
+
+    :param name: Name of the controller class.
+    :return: The controller class.
+    :raises AttributeError: If `name` is not an exported controller.
+    """
+
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Lists loaded attributes along with every lazily exported controller.
+
+    :return: Sorted attribute names.
+    """
+
+    return sorted(set(globals()) | set(__all__))
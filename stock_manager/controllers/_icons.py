@@ -0,0 +1,24 @@
+"""
+Cached icons for the controllers.
+
+Icons shared between pages are only rendered once per process.
+"""
+
+import functools
+
+from PyQt5.QtGui import QIcon
+
+
+@functools.lru_cache(maxsize=None)
+def icon(name: str, color: str = 'white') -> QIcon:
+    """
+    Create a qtawesome icon, caching the result.
+
+    :param name: The qtawesome icon name, e.g. `'fa5s.search'`.
+    :param color: The icon color, independent of `qta.set_defaults`.
+    :return: The icon.
+    """
+
+    import qtawesome as qta
+
+    return qta.icon(name, color=color)
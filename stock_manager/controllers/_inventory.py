@@ -0,0 +1,264 @@
+"""
+Qt table model for inventory items
+in the Stock Management Application.
+
+Defines the InventoryModel class, which exposes the application's
+list of `Item` objects to a QTableView without copying them into
+per-cell Qt items, and the InventoryFilterProxyModel used to search it.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy
+from numpy import ndarray
+from PyQt5.QtCore import (QAbstractTableModel, QModelIndex, QObject,
+                          QSortFilterProxyModel, Qt)
+
+import stock_manager
+
+if TYPE_CHECKING:
+    from stock_manager.model import Item
+
+
+class InventoryModel(QAbstractTableModel):
+    """
+    Read-only table model backed directly by a list of `Item` objects.
+
+    Cells are only formatted when the view asks for them, so refreshing
+    the table is a model reset instead of rebuilding every cell.
+    """
+
+    def __init__(
+        self,
+        items: Optional[list['Item']] = None,
+        parent: Optional[QObject] = None
+    ):
+        """
+        Initialize the inventory model.
+
+        :param items: The items to display, the list is referenced, not copied.
+        :param parent: Parent Qt object.
+        """
+
+        super().__init__(parent)
+        self._items: list['Item'] = items if items is not None else []
+        self._row_count = len(self._items)
+        self._text: Optional[list[tuple[str, ...]]] = None
+        self._sort_keys: Optional[list[tuple[Any, ...]]] = None
+        self._haystack: Optional[ndarray] = None
+
+    def set_items(self, items: list['Item']) -> None:
+        """
+        Replace the displayed items and notify attached views.
+
+        :param items: The items to display, the list is referenced, not copied.
+        """
+
+        self.beginResetModel()
+        self._items = items
+        self._row_count = len(items)
+        self._text = None
+        self._sort_keys = None
+        self._haystack = None
+        self.endResetModel()
+
+    def update_items(self, items: list['Item']) -> None:
+        """
+        Show `items`, only signalling what changed instead of resetting
+        the model when they are the same list, e.g. after items were
+        edited in place or appended. Views keep their selection and
+        scroll position in that case.
+
+        :param items: The items to display, the list is referenced, not copied.
+        """
+
+        if items is not self._items or len(items) < self._row_count:
+            self.set_items(items)
+            return
+
+        if len(items) > self._row_count:
+            self._insert_appended()
+            return
+
+        self._text = None
+        self._sort_keys = None
+        self._haystack = None
+        if self._row_count:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._row_count - 1, self.columnCount() - 1),
+                [Qt.DisplayRole]
+            )
+
+    def _insert_appended(self) -> None:
+        """Announces items appended to the list since it was last shown."""
+
+        first, last = self._row_count, len(self._items) - 1
+        self.beginInsertRows(QModelIndex(), first, last)
+        if self._text is not None:
+            self._text.extend(
+                tuple(map(str, item)) for item in self._items[first:]
+            )
+        self._sort_keys = None
+        self._haystack = None
+        self._row_count = last + 1
+        self.endInsertRows()
+
+    def cell_text(self) -> list[tuple[str, ...]]:
+        """
+        Display text of every cell, one tuple per item, built
+        on first use and kept until the model is next reset.
+
+        :return: The cached cell text.
+        """
+
+        if self._text is None:
+            self._text = [tuple(map(str, item)) for item in self._items]
+        return self._text
+
+    def search_haystack(self) -> ndarray:
+        """
+        Lowercased text of each row, its cells joined by a unit separator
+        so a search cannot match across two of them, as a 1-D string
+        array built on first use and kept until the items next change.
+
+        :return: The cached search haystack.
+        """
+
+        if self._haystack is None:
+            self._haystack = numpy.array(
+                ['\x1f'.join(row).lower() for row in self.cell_text()],
+                dtype=str
+            )
+        return self._haystack
+
+    def sort_keys(self) -> list[tuple[Any, ...]]:
+        """
+        Value to order each cell by, one tuple per item: numbers as
+        themselves, so 10 sorts after 2, `None` as-is, and anything
+        else by its casefolded text. Built on first use and kept until
+        the items next change, so sorting never rebuilds an item's values.
+
+        :return: The cached sort keys.
+        """
+
+        if self._sort_keys is None:
+            self._sort_keys = [
+                tuple(
+                    value
+                    if value is None or isinstance(value, (int, float))
+                    else text.casefold()
+                    for value, text in zip(item, row)
+                )
+                for item, row in zip(self._items, self.cell_text())
+            ]
+        return self._sort_keys
+
+    def sort_value(self, row: int, column: int) -> Any:
+        """
+        Value to order a cell by, see `sort_keys`.
+
+        :param row: The cell's row.
+        :param column: The cell's column.
+        :return: The sort value.
+        """
+
+        return self.sort_keys()[row][column]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        # not len(self._items), appended items are hidden until announced
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(stock_manager.utils.KEEP_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.cell_text()[index.row()][index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.DisplayRole
+    ) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return stock_manager.utils.KEEP_HEADERS[section]
+        return section + 1
+
+
+class InventoryFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filter proxy for an `InventoryModel` that matches a case-insensitive
+    substring against every column, and sorts on the source's typed
+    values rather than display strings.
+
+    Matching rows are computed for the whole table in one vectorized
+    pass over the source's search haystack, so `filterAcceptsRow` is a
+    single array lookup instead of a `data()` call per cell.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize the filter proxy with no active filter.
+
+        :param parent: Parent Qt object.
+        """
+
+        super().__init__(parent)
+        self._needle = ''
+        self._mask: Optional[ndarray] = None
+        self._mask_haystack: Optional[ndarray] = None
+
+    def set_filter_text(self, text: str) -> None:
+        """
+        Show only rows with a cell containing `text`, ignoring case.
+
+        :param text: The text to search for, empty shows every row.
+        """
+
+        needle = text.lower()
+        if needle == self._needle:
+            # e.g. clearing an already empty search box
+            return
+
+        self._needle = needle
+        self._clear_mask()
+        self.invalidateFilter()
+
+    def _clear_mask(self) -> None:
+        """Discards the cached row mask so it is rebuilt on next use."""
+
+        self._mask = None
+        self._mask_haystack = None
+
+    def filterAcceptsRow(
+        self,
+        source_row: int,
+        source_parent: QModelIndex
+    ) -> bool:
+        if not self._needle:
+            return True
+
+        # the source rebuilds its haystack whenever its items change,
+        # so a new haystack means the mask is stale
+        haystack = self.sourceModel().search_haystack()
+        if haystack is not self._mask_haystack:
+            self._mask = numpy.char.find(haystack, self._needle) >= 0
+            self._mask_haystack = haystack
+        return bool(self._mask[source_row])
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        source = self.sourceModel()
+        a = source.sort_value(left.row(), left.column())
+        b = source.sort_value(right.row(), right.column())
+        if a is None or b is None:
+            # empty cells sort first
+            return a is None and b is not None
+        try:
+            return a < b
+        except TypeError:
+            return str(a) < str(b)
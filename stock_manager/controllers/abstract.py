@@ -8,22 +8,32 @@ functionality, or reusable connection logic for concrete page controllers.
 """
 
 import logging
+import time
 from abc import ABC, ABCMeta, abstractmethod
-from pathlib import Path
-from typing import TYPE_CHECKING, Union
-
-from numpy import ndarray
-from PyQt5.QtCore import QSortFilterProxyModel, Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QStandardItem, QStandardItemModel
-from PyQt5.QtWidgets import (QAbstractItemView, QFileDialog, QMessageBox,
-                             QPushButton, QWidget)
+from typing import TYPE_CHECKING, ClassVar, Optional, Union
+
+import cv2
+from numpy import ascontiguousarray, ndarray
+from PyQt5.QtCore import (QModelIndex, QMutex, QMutexLocker, Qt, QThread,
+                          QTimer, QWaitCondition, pyqtSignal, pyqtSlot)
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtWidgets import (QAbstractItemView, QFileDialog, QHeaderView,
+                             QMessageBox, QPushButton, QWidget)
 from PyQt5.uic import loadUi
 
 import stock_manager
 
+from ._inventory import InventoryFilterProxyModel, InventoryModel
+
 if TYPE_CHECKING:
     from stock_manager.app import App
 
+_EXPORTS_DIR = str(stock_manager.utils.EXPORTS_DIR)
+
+# bound once for the per-frame display path
+_BGR888 = QImage.Format.Format_BGR888
+_FROM_IMAGE = QPixmap.fromImage
+
 
 class CombinedMeta(type(QWidget), ABCMeta):
     """
@@ -37,7 +47,17 @@ class CombinedMeta(type(QWidget), ABCMeta):
 
 
 class AbstractController(ABC, QWidget, metaclass=CombinedMeta):
-    """Abstract controller with common UI behavior for the application."""
+    """
+    Abstract controller with common UI behavior for the application.
+
+    Subclasses list the widgets their code relies on in `REQUIRED_WIDGETS`,
+    checked once when the UI is loaded. A `table` must come with a
+    `search` box, which `update_table()` and filtering rely on.
+    """
+
+    REQUIRED_WIDGETS: ClassVar[tuple[str, ...]] = ()
+    NOTIFY_INTERVAL = 5.0
+    SEARCH_DEBOUNCE = 150
 
     def __init__(self, file_name: str, app: 'App'):
         """
@@ -53,19 +73,52 @@ class AbstractController(ABC, QWidget, metaclass=CombinedMeta):
         self.logger = logging.getLogger()
         self.database = app.db
         self.PAGE_NAME: Union[stock_manager.utils.Pages, None] = None
+        self._last_notified: dict[str, float] = {}
+        self._has_table = False
 
         try:
-            ui_path = Path(
-                __file__
-            ).resolve().parent.parent.parent / 'ui' / f'{file_name}.ui'
-            loadUi(str(ui_path), self)
+            loadUi(str(stock_manager.utils.UI_DIR / f'{file_name}.ui'), self)
         except Exception as e:
             self.logger.error(f'Failed To Load {file_name}.ui File: {e}')
-            QMessageBox.critical(
-                self,
+            self._notify(
+                'critical',
                 f'{file_name}.ui Failure',
                 f'Failed To Load {file_name}.ui File'
             )
+            # the failure has been reported, every widget is missing
+            return
+
+        missing = [
+            name for name in self.REQUIRED_WIDGETS if not hasattr(self, name)
+        ]
+        if missing:
+            raise AttributeError(
+                f'{type(self).__name__} Is Missing Widgets: '
+                + ', '.join(missing)
+            )
+
+        self._has_table = 'table' in self.REQUIRED_WIDGETS
+        if self._has_table:
+            self._setup_table()
+
+    def _notify(self, kind: str, title: str, body: str) -> None:
+        """
+        Shows a message box, at most once every `NOTIFY_INTERVAL` seconds
+        per title, so a failure repeating on every frame or refresh
+        cannot stack up dialogs. Callers log every occurrence themselves.
+
+        :param kind: The `QMessageBox` method to use, e.g. `'critical'`.
+        :param title: The message box title.
+        :param body: The message box text.
+        """
+
+        now = time.monotonic()
+        if (now - self._last_notified.get(title, float('-inf'))
+                < self.NOTIFY_INTERVAL):
+            return
+
+        self._last_notified[title] = now
+        getattr(QMessageBox, kind)(self, title, body)
 
     @abstractmethod
     def handle_connections(self) -> None:
@@ -77,9 +130,68 @@ class AbstractController(ABC, QWidget, metaclass=CombinedMeta):
         """
         ...
 
+    def _setup_table(self) -> None:
+        """
+        Attaches the inventory models to `table`, configures the view
+        and connects `search` to the filter, once per controller.
+        `update_table()` then only swaps in the current items.
+        """
+
+        self._source_model = InventoryModel(parent=self)
+        self._proxy_model = InventoryFilterProxyModel(self)
+        self._proxy_model.setSourceModel(self._source_model)
+
+        self.table.setModel(self._proxy_model)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setDropIndicatorShown(False)
+        self.table.setDragDropOverwriteMode(False)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setWordWrap(True)
+        self.table.setCornerButtonEnabled(False)
+        # fixed sizes, so no cell text is measured when rows change
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.Interactive
+        )
+        # keep inventory order until a header is clicked
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+
+        # only filter once typing pauses for SEARCH_DEBOUNCE milliseconds
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE)
+        self._search_timer.timeout.connect(self._filter_table)
+        self.search.textChanged.connect(self._search_timer.start)
+
+    def _filter_table(self) -> None:
+        """
+        Filters the table by the search text with repainting suspended,
+        so the rows the filter hides or shows are laid out and painted once.
+        """
+
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._proxy_model.set_filter_text(self.search.text())
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _source_row(self, index: QModelIndex) -> int:
+        """
+        Maps an index of `table` to its item's position in `app.all_items`,
+        which differs from `index.row()` once the table is sorted or filtered.
+
+        :param index: The index of a cell in `table`.
+        :return: The row of the cell's item in `app.all_items`.
+        """
+
+        return self._proxy_model.mapToSource(index).row()
+
     async def update_table(self) -> bool:
         """
-        Initializes the table widget with all inventory data from the database.
+        Refreshes the table with all inventory data from the database.
         Only works if child controller has a QTableView object called 'table'
         and a QLineEdit named 'search'.
 
@@ -87,52 +199,26 @@ class AbstractController(ABC, QWidget, metaclass=CombinedMeta):
         object does not have a table, `False` if a failure occurs.
         """
 
-        if not hasattr(self, 'table'):
-            QMessageBox.warning(
-                self,
-                'No Table Found',
-                'No Table Object Found In Controller, '
-                'Make Sure This Method Is Being Called In A Controller '
-                'That Has A Table Object Called "Table".'
+        if not self._has_table:
+            self.logger.warning(
+                f'{type(self).__name__} Has No Table To Update'
             )
             return True
 
-        all_data = self.app.all_items
-        source_model = QStandardItemModel()
-        proxy_model = QSortFilterProxyModel()
-
-        source_model.setHorizontalHeaderLabels(
-            stock_manager.utils.KEEP_HEADERS
-        )
-        for item in all_data:
-            items = [QStandardItem(str(value)) for value in item]
-            source_model.appendRow(items)
-
+        self.table.setUpdatesEnabled(False)
         try:
-            proxy_model.setSourceModel(source_model)
-            proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-            proxy_model.setFilterKeyColumn(-1)
-
-            self.table.setModel(proxy_model)
-            self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-            self.table.setDropIndicatorShown(False)
-            self.table.setDragDropOverwriteMode(False)
-            self.table.setAlternatingRowColors(True)
-            self.table.setSelectionMode(QAbstractItemView.SingleSelection)
-            self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-            self.table.setWordWrap(True)
-            self.table.setCornerButtonEnabled(False)
-
-            self.search.textChanged.connect(proxy_model.setFilterFixedString)
+            self._source_model.update_items(self.app.all_items)
             return True
         except Exception as e:
             self.logger.error(f'Error Updating Table: {e}')
-            QMessageBox.warning(
-                self,
+            self._notify(
+                'warning',
                 'Table Update Error',
                 'Failed To Update Table, Please Try Again.'
             )
             return False
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def to_page(self) -> None:
         """Navigate to this controller's page in the stacked widget."""
@@ -166,17 +252,25 @@ class AbstractScanner(AbstractController):
     camera threads, QR code processing, and video display updates.
     """
 
+    REQUIRED_WIDGETS = ('video_lbl',)
+
     def __init__(self, file_name: str, app: 'App'):
         """
         Initialize the Abstract Scanner controller.
-        Creates reference to `_CameraThread` as `self.camera_thread`.
+        Creates reference to `_CameraThread` as `self.camera_thread`
+        and `_DecoderThread` as `self.decoder_thread`.
 
         :param file_name: The name of the .ui file (without extension) to load.
         :param app: Reference to the main application instance.
         """
 
         super().__init__(file_name, app)
+        self._last_display_error = float('-inf')
         self.camera_thread = self._CameraThread()
+        self.decoder_thread = self._DecoderThread(self.camera_thread)
+        self.camera_thread.camera_failed.connect(self._on_camera_failed)
+        self.decoder_thread.display_ready.connect(self.display_frame)
+        self.decoder_thread.qr_decoded.connect(self.check_for_qr)
 
     def to_page(self) -> None:
         """Navigate to this scanner page and start the video feed."""
@@ -185,8 +279,8 @@ class AbstractScanner(AbstractController):
             self.start_video()
         except Exception as e:
             self.logger.error(f'Failed To Start QR Scanner: {e}')
-            QMessageBox.critical(
-                self,
+            self._notify(
+                'critical',
                 'QR Scanner Error',
                 'Failed To Start QR Scanner'
             )
@@ -195,22 +289,21 @@ class AbstractScanner(AbstractController):
 
     def start_video(self) -> bool:
         """
-        Start the camera thread and begin capturing video frames.
-
-        Connects the thread’s signal to the frame processor.
+        Start the camera and decoder threads and begin capturing video frames.
 
         :return: `True` if camera is started successfully, `False` otherwise.
         """
 
         try:
             if not self.camera_thread.running:
-                self.camera_thread.frame_ready.connect(self.process_frame)
                 self.camera_thread.start()
+            if not self.decoder_thread.running:
+                self.decoder_thread.start()
             return True
         except Exception as e:
             self.logger.error(f'Error Starting Camera Thread: {e}')
-            QMessageBox.critical(
-                self,
+            self._notify(
+                'critical',
                 'Camera Failure',
                 'Failed To Start Camera'
             )
@@ -227,69 +320,78 @@ class AbstractScanner(AbstractController):
         """
 
         try:
+            if self.decoder_thread.running:
+                self.decoder_thread.stop()
+                self.decoder_thread.wait()
             if self.camera_thread.running:
                 self.camera_thread.stop()
                 self.camera_thread.wait()
             return True
         except Exception as e:
             self.logger.error(f'Error Stopping Camera Thread: {e}')
-            QMessageBox.critical(
-                self,
+            self._notify(
+                'critical',
                 'Camera Failure',
                 'Failed To Stop Camera'
             )
             return False
 
-    def process_frame(self, frame: ndarray) -> None:
+    def _on_camera_failed(self, message: str) -> None:
+        """
+        Reports a failure raised by the camera thread on the GUI thread.
+
+        :param message: Description of the failure.
         """
-        Process a single frame from the camera feed.
 
-        Sends the frame to subclass's `check_for_qr()`
-        to asynchronously decode and manage QR data.
+        self._notify('critical', 'Camera Failure', message)
 
-        :param frame: A single image frame from the camera.
+    def display_frame(self, frame: ndarray, timestamp: float) -> None:
         """
+        Show a camera frame in the video label.
 
-        self.check_for_qr(frame)
+        The BGR frame is wrapped as a `Format_BGR888` QImage without
+        converting or copying it. The image only borrows the array's
+        buffer until `QPixmap.fromImage` copies it, after which the
+        buffer is handed back to the camera thread for reuse.
 
-        try:
-            import cv2
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        except Exception as e:
-            self.logger.warning(f'Failed To Convert Frame Color: {e}')
-            QMessageBox.warning(
-                self,
-                'Color Conversion Error',
-                'Failed To Convert Frame Color'
-            )
+        Frames older than the decoder's latest are dropped unpainted,
+        since a newer one is already queued behind them.
+
+        :param frame: A BGR image frame from the camera.
+        :param timestamp: When the frame was captured, from `time.monotonic`.
+        """
 
         try:
-            from PyQt5.QtGui import QImage, QPixmap
+            if timestamp < self.decoder_thread.latest_timestamp:
+                return
 
             h, w, ch = frame.shape
-            bytes_per_line = ch * w
             q_img = QImage(
-                frame.data, w, h, bytes_per_line,
-                QImage.Format.Format_RGB888
+                ascontiguousarray(frame).data, w, h, ch * w, _BGR888
             )
-            self.video_lbl.setPixmap(QPixmap.fromImage(q_img))
+            self.video_lbl.setPixmap(_FROM_IMAGE(q_img))
         except Exception as e:
-            self.logger.error(f'Failed To Update Video Label: {e}')
-            QMessageBox.critical(
-                self,
+            now = time.monotonic()
+            if now - self._last_display_error >= 1.0:
+                self._last_display_error = now
+                self.logger.error(f'Failed To Update Video Label: {e}')
+            self._notify(
+                'critical',
                 'Video Label Failure',
                 'Failed To Update Video Label'
             )
+        finally:
+            self.camera_thread.release_frame(frame)
 
     @abstractmethod
-    async def check_for_qr(self, frame: ndarray) -> bool:
+    def check_for_qr(self, data: str) -> bool:
         """
-        Asynchronously check the given video frame for a QR code.
+        Handle a QR code decoded from the video feed.
 
-        Subclasses must implement this method to process the frame,
-        decode any QR codes found, and handle any related actions.
+        Subclasses must implement this method to act on
+        the decoded data, such as logging in or adding an item.
 
-        :param frame: The video frame to analyze.
+        :param data: The text decoded from the QR code.
         """
         ...
 
@@ -297,54 +399,281 @@ class AbstractScanner(AbstractController):
         """
         Thread to handle continuous video capture from the camera.
 
-        Runs in the background to read frames from the webcam and emit them
-        via the `frame_ready` signal for processing elsewhere in
-        the application.
-        """
+        Runs in the background to grab every frame from the webcam, keeping
+        the driver's queue drained, but only retrieves (converts) a frame
+        while `take_frame()` is waiting for one. A slow consumer skips
+        frames instead of falling behind the camera, and skipped frames
+        are never converted.
 
-        frame_ready = pyqtSignal(object)
+        Frames are retrieved into recycled buffers: those handed back
+        through `release_frame()` are reused for later frames,
+        keeping up to `MAX_SPARE_BUFFERS` of them.
+        """
 
-        def __init__(self, parent=None):
+        MAX_SPARE_BUFFERS = 2
+        OPEN_ATTEMPTS = 3
+        OPEN_RETRY_DELAY = 500
+        FAIL_LOG_EVERY = 30
+        FAIL_LIMIT = 90
+
+        camera_failed = pyqtSignal(str)
+
+        def __init__(
+            self,
+            width: int = 640,
+            height: int = 480,
+            frame_rate: int = 30,
+            buffer_size: int = 1,
+            parent=None
+        ):
             """
-            Initialize the camera thread.
-
+            Initialize the camera thread. The capture settings are requests
+            to the camera driver, which may pick the nearest it supports.
+
+            :param width: Capture width in pixels.
+            :param height: Capture height in pixels.
+            :param frame_rate: Frames per second to capture and hand over.
+            :param buffer_size: Frames the driver may queue, kept small
+            so retrieved frames are current.
             :param parent: Parent Qt object.
             """
 
             super().__init__(parent)
+            self.width = width
+            self.height = height
+            self.frame_rate = frame_rate
+            self.buffer_size = buffer_size
             self.running = False
             self._logger = logging.getLogger()
+            self._mutex = QMutex()
+            self._frame_available = QWaitCondition()
+            self._latest: Optional[ndarray] = None
+            self._latest_timestamp = 0.0
+            self._consumer_ready = False
+            self._spare: list[ndarray] = []
 
         def run(self) -> None:
             """
             Start the video capture loop.
 
-            Continuously captures frames from the default webcam and emits
-            each frame through the `frame_ready` signal.
+            Continuously grabs frames from the default webcam,
+            retrieving one whenever a consumer is waiting. Opening the
+            camera is tried `OPEN_ATTEMPTS` times, `OPEN_RETRY_DELAY`
+            milliseconds apart, before `camera_failed` is emitted.
 
-            If an exception occurs, the user is offered the option to retry.
-            """
+            Failed grabs are logged every `FAIL_LOG_EVERY` in a row, and
+            `camera_failed` is emitted once `FAIL_LIMIT` fail in a row,
+            while the loop keeps trying in case the camera recovers.
 
-            from cv2 import VideoCapture
+            Frames are retrieved at most `frame_rate` times per second,
+            the schedule advancing by whole intervals so the average
+            rate holds even though grabs land between due times.
+            """
 
             self.running = True
-            cap = VideoCapture(0)
-            if not cap.isOpened():
+            for attempt in range(1, self.OPEN_ATTEMPTS + 1):
+                cap = cv2.VideoCapture(0)
+                if cap.isOpened():
+                    break
+
+                cap.release()
+                self._logger.warning(
+                    f'Could Not Access Camera, Attempt {attempt}'
+                )
+                if not self.running:
+                    return
+                self.msleep(self.OPEN_RETRY_DELAY)
+            else:
                 self._logger.error('Could Not Access Camera')
+                self.camera_failed.emit('Could Not Access Camera')
+                # lets the next visit to the page try again
+                self.running = False
                 return
 
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+            cap.set(cv2.CAP_PROP_FPS, self.frame_rate)
+
+            failures = 0
+            next_due = time.monotonic()
+            grab, retrieve = cap.grab, cap.retrieve
             while self.running:
-                worked, frame = cap.read()
-                if worked:
-                    self.frame_ready.emit(frame)
+                if not grab():
+                    failures += 1
+                    if failures % self.FAIL_LOG_EVERY == 0:
+                        self._logger.warning(
+                            f'Failed To Grab {failures} Camera Frames In A Row'
+                        )
+                    if failures == self.FAIL_LIMIT:
+                        self.camera_failed.emit(
+                            'Camera Stopped Sending Frames'
+                        )
+                    self.msleep(10)
+                    continue
+                failures = 0
+
+                now = time.monotonic()
+                if now < next_due:
                     continue
 
+                with QMutexLocker(self._mutex):
+                    if not self._consumer_ready:
+                        continue
+                    buffer = self._spare.pop() if self._spare else None
+
+                interval = 1 / self.frame_rate
+                next_due += interval
+                if next_due < now:
+                    # fell behind, don't try to catch up with a burst
+                    next_due = now + interval
+
+                # fills `buffer` in place when its shape matches
+                worked, frame = retrieve(buffer)
+                if not worked:
+                    if buffer is not None:
+                        self.release_frame(buffer)
+                    continue
+
+                with QMutexLocker(self._mutex):
+                    self._latest = frame
+                    self._latest_timestamp = time.monotonic()
+                    self._consumer_ready = False
+                    self._frame_available.wakeOne()
+
             cap.release()
 
+        def take_frame(
+            self,
+            timeout: int = 100
+        ) -> Optional[tuple[ndarray, float]]:
+            """
+            Wait for the next frame the camera grabs.
+
+            :param timeout: Milliseconds to wait for a new frame.
+            :return: The frame and its `time.monotonic` capture time,
+            `None` if none arrived in time.
+            """
+
+            with QMutexLocker(self._mutex):
+                if self._latest is None:
+                    self._consumer_ready = True
+                    self._frame_available.wait(self._mutex, timeout)
+                if self._latest is None:
+                    return None
+                frame, self._latest = self._latest, None
+                return frame, self._latest_timestamp
+
+        def release_frame(self, frame: ndarray) -> None:
+            """
+            Hand a frame taken with `take_frame()` back for reuse.
+            The caller must not use `frame` afterwards.
+
+            :param frame: The frame that is no longer needed.
+            """
+
+            with QMutexLocker(self._mutex):
+                if len(self._spare) < self.MAX_SPARE_BUFFERS:
+                    self._spare.append(frame)
+
         def stop(self) -> None:
             """Stop the video capture loop."""
             self.running = False
 
+    class _DecoderThread(QThread):
+        """
+        Thread to decode QR codes and prepare frames for display.
+
+        Takes the latest frame from a `_CameraThread`, emits any decoded QR
+        data through `qr_decoded` and the frame itself through
+        `display_ready`, so the GUI thread only handles results and painting.
+
+        The decoder only sees a grayscale copy of each frame, shrunk to at
+        most `DECODE_MAX_WIDTH` pixels wide, and frames too flat to hold a
+        QR code (standard deviation below `BLANK_STDDEV`) are not decoded.
+        Only every `DECODE_STRIDE`th frame is decoded at all, while every
+        frame is still displayed.
+        """
+
+        DECODE_MAX_WIDTH = 960
+        BLANK_STDDEV = 4.0
+        DECODE_STRIDE = 3
+
+        display_ready = pyqtSignal(object, float)
+        qr_decoded = pyqtSignal(str)
+
+        def __init__(self, camera_thread: 'AbstractScanner._CameraThread',
+                     parent=None):
+            """
+            Initialize the decoder thread.
+
+            :param camera_thread: The camera thread to take frames from.
+            :param parent: Parent Qt object.
+            """
+
+            super().__init__(parent)
+            self.running = False
+            self._camera_thread = camera_thread
+            self._logger = logging.getLogger()
+            self.latest_timestamp = 0.0
+
+        def run(self) -> None:
+            """
+            Start the decoding loop, handling frames as fast as it can
+            and skipping any captured while it was busy.
+            """
+
+            self.running = True
+            decode = cv2.QRCodeDetector().detectAndDecode
+            take_frame = self._camera_thread.take_frame
+            frame_count = 0
+
+            while self.running:
+                taken = take_frame()
+                if taken is None:
+                    continue
+                frame, timestamp = taken
+
+                frame_count += 1
+                if frame_count % self.DECODE_STRIDE == 0:
+                    try:
+                        gray = self._decode_input(frame)
+                        data = decode(gray)[0] if gray is not None else ''
+                    except cv2.error as e:
+                        self._logger.warning(f'Failed To Decode Frame: {e}')
+                        data = ''
+                    if data:
+                        self.qr_decoded.emit(data)
+
+                self.latest_timestamp = timestamp
+                self.display_ready.emit(frame, timestamp)
+
+        def _decode_input(self, frame: ndarray) -> Optional[ndarray]:
+            """
+            Reduce a BGR frame to what the QR decoder needs.
+
+            :param frame: A BGR image frame from the camera.
+            :return: The grayscale, possibly downscaled frame,
+            or `None` if the frame is blank.
+            """
+
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+            width = gray.shape[1]
+            if width > self.DECODE_MAX_WIDTH:
+                scale = self.DECODE_MAX_WIDTH / width
+                gray = cv2.resize(
+                    gray, None, fx=scale, fy=scale,
+                    interpolation=cv2.INTER_AREA
+                )
+
+            _, stddev = cv2.meanStdDev(gray)
+            return gray if stddev[0, 0] >= self.BLANK_STDDEV else None
+
+        def stop(self) -> None:
+            """Stop the decoding loop."""
+            self.running = False
+
 
 class AbstractExporter(AbstractController):
     """
@@ -354,6 +683,8 @@ class AbstractExporter(AbstractController):
     file exports, file dialogues, and file name generation.
     """
 
+    REQUIRED_WIDGETS = ('location_btn',)
+
     def __init__(self, file_name: str, app: 'App'):
         """
         Initialize the AbstractExporter controller.
@@ -364,9 +695,7 @@ class AbstractExporter(AbstractController):
         """
 
         super().__init__(file_name, app)
-        self.path = str(
-            Path(__file__).resolve().parent.parent.parent / 'exports'
-        )
+        self.path = _EXPORTS_DIR
 
     def get_directory(self, button: QPushButton) -> None:
         """
@@ -381,12 +710,7 @@ class AbstractExporter(AbstractController):
 
         try:
             response = QFileDialog.getExistingDirectory(
-                self, 'Select A Folder',
-                str(
-                    Path(
-                        __file__
-                    ).resolve().parent.parent.parent / 'exports'
-                )
+                self, 'Select A Folder', _EXPORTS_DIR
             )
             response = str(response)
             self.path = response
@@ -409,6 +733,12 @@ class AbstractExporter(AbstractController):
             if response == QMessageBox.Retry:
                 self.get_directory(button)
 
+    @pyqtSlot()
+    def _choose_location(self) -> None:
+        """Slot for `location_btn`, choosing the directory to export to."""
+
+        self.get_directory(self.location_btn)
+
     @abstractmethod
     def export(self) -> None:
         """
@@ -6,12 +6,16 @@ Provides logic for the user to add new stock items, including form validation,
 computation of totals and excess, and updating the database.
 """
 
-from typing import TYPE_CHECKING, Union
+from operator import methodcaller
+from typing import TYPE_CHECKING, Callable, ClassVar, Union
 
-from PyQt5.QtWidgets import QLineEdit, QMessageBox, QSpinBox, QTextEdit
+from PyQt5.QtCore import QTimer, pyqtSlot
+from PyQt5.QtWidgets import (QLineEdit, QMessageBox, QSpinBox, QTextEdit,
+                             QWidget)
 
 import stock_manager
 from stock_manager.controllers import AbstractController
+from stock_manager.controllers._icons import icon
 
 if TYPE_CHECKING:
     from stock_manager.app import App
@@ -25,6 +29,13 @@ class Add(AbstractController):
     computing totals and excess, and updating the database.
     """
 
+    SPINNER_DEBOUNCE = 50
+    # text getter for each exact type in `_text_fields`
+    TEXT_GETTERS: ClassVar[dict[type, Callable[[QWidget], str]]] = {
+        QLineEdit: methodcaller('text'),
+        QTextEdit: methodcaller('toPlainText')
+    }
+
     def __init__(self, app: 'App'):
         """
         Initialize the Add page controller.
@@ -36,34 +47,47 @@ class Add(AbstractController):
         super().__init__(page.value.FILE_NAME, app)
         self.PAGE_NAME = page
         self._total = self._excess = 0
-        self._spinners: set[QSpinBox] = {
+        # bound once, they are called on every spinner change
+        self._total_equation = stock_manager.utils.total_equation
+        self._excess_equation = stock_manager.utils.excess_equation
+        self._spinners: tuple[QSpinBox, ...] = (
             self.b750_spinner,
             self.b757_spinner,
             self.min_750_spinner,
             self.min_757_spinner
-        }
-        self._text_fields: set[Union[QLineEdit, QTextEdit]] = {
+        )
+        self._text_fields: tuple[Union[QLineEdit, QTextEdit], ...] = (
             self.part_num,
             self.manufacturer,
             self.desc
-        }
+        )
+        # spinner values in `_spinners` order, kept current by
+        # `_recompute` so submitting does not read them again
+        self._spinner_values: tuple[int, ...] = tuple(
+            spinner.value() for spinner in self._spinners
+        )
+
+        # only recompute once spinner input pauses for SPINNER_DEBOUNCE
+        # milliseconds, e.g. once per number typed instead of per digit
+        self._recompute_timer = QTimer(self)
+        self._recompute_timer.setSingleShot(True)
+        self._recompute_timer.setInterval(self.SPINNER_DEBOUNCE)
+        self._recompute_timer.timeout.connect(self._recompute)
 
         self.handle_connections()
 
     def handle_connections(self) -> None:
-        import qtawesome as qta
-
         self.clear_btn.clicked.connect(self._clear_form)
         self.submit_btn.clicked.connect(self._submit_form)
 
+        on_spinner_change = self._on_spinner_change
         for spinner in self._spinners:
-            spinner.valueChanged.connect(self._on_spinner_change)
-
-        qta.set_defaults(color='white')
+            spinner.valueChanged.connect(on_spinner_change)
 
-        self.clear_btn.setIcon(qta.icon('fa5s.backspace'))
-        self.submit_btn.setIcon(qta.icon('fa5s.plus-square'))
+        self.clear_btn.setIcon(icon('fa5s.backspace'))
+        self.submit_btn.setIcon(icon('fa5s.plus-square'))
 
+    @pyqtSlot(int)
     def _on_spinner_change(self, _) -> None:
         """
         Handle changes in spinner values.
@@ -71,19 +95,24 @@ class Add(AbstractController):
         :param _: The spinner event parameter (unused).
         """
 
+        self._recompute_timer.start()
+
+    def _recompute(self) -> None:
+        """Recompute and display the total and excess from the spinners."""
+
+        self._recompute_timer.stop()
+        values = tuple(spinner.value() for spinner in self._spinners)
+        if values == self._spinner_values:
+            # e.g. a spinner changed and was changed back
+            return
+        self._spinner_values = b750, b757, min_750, min_757 = values
+
         try:
-            self._total = stock_manager.utils.total_equation(
-                self.b750_spinner.value(),
-                self.b757_spinner.value()
-            )
-            self._excess = stock_manager.utils.excess_equation(
-                self._total,
-                self.min_750_spinner.value(),
-                self.min_757_spinner.value()
-            )
+            self._total = self._total_equation(b750, b757)
+            self._excess = self._excess_equation(self._total, min_750, min_757)
 
-            self.total_lbl.setText('Total: ' + str(self._total))
-            self.excess_lbl.setText('Excess: ' + str(self._excess))
+            self.total_lbl.setText(f'Total: {self._total}')
+            self.excess_lbl.setText(f'Excess: {self._excess}')
         except Exception as e:
             self.logger.error(f'Spinner Change Error: {e}')
             QMessageBox.critical(
@@ -92,6 +121,7 @@ class Add(AbstractController):
                 'Failed To Compute Spinner Data'
             )
 
+    @pyqtSlot()
     def _clear_form(self) -> None:
         """
         Clear all text fields and reset all spinner values.
@@ -103,8 +133,13 @@ class Add(AbstractController):
         for text_field in self._text_fields:
             text_field.clear()
         for spinner in self._spinners:
+            # recomputed once below instead of once per spinner
+            spinner.blockSignals(True)
             spinner.setValue(0)
+            spinner.blockSignals(False)
+        self._recompute()
 
+    @pyqtSlot()
     def _submit_form(self) -> bool:
         """
         Validate the form and submit a new stock item.
@@ -125,28 +160,16 @@ class Add(AbstractController):
             :return: True if any fields are empty or False if all are filled
             """
 
-            empty_line_edits = {
-                field.objectName()
-                for field in self._text_fields
-                if isinstance(field, QLineEdit) and not field.text().strip()
-            }
-            empty_text_edits = {
-                field.objectName()
+            # both checks stop at the first field that decides them
+            text_getters = self.TEXT_GETTERS
+            return any(
+                not text_getters[type(field)](field).strip()
                 for field in self._text_fields
-                if isinstance(field, QTextEdit)
-                and not field.toPlainText().strip()
-            }
-            valued_spinners = {
-                spinner.objectName() for spinner in self._spinners
-                if spinner.value()
-            }
-
-            return True if any(
-                [
-                    empty_line_edits,
-                    empty_text_edits
-                ]
-            ) or not any(valued_spinners) else False
+            ) or not any(self._spinner_values)
+
+        if self._recompute_timer.isActive():
+            # a spinner changed too recently to have been recomputed
+            self._recompute()
 
         if empty_fields_check():
             QMessageBox.information(
@@ -157,29 +180,13 @@ class Add(AbstractController):
             )
             return False
 
-        new_item = stock_manager.model.Item(
-            self.part_num.text(),
-            self.manufacturer.text(),
-            self.desc.toPlainText(),
-            self._total,
-            self.b750_spinner.value(),
-            self.b757_spinner.value(),
-            self.min_750_spinner.value(),
-            self._excess,
-            self.min_757_spinner.value()
-        )
+        part_num = self.part_num.text()
 
-        if any(
-                [
-                    item
-                    for item in self.app.all_items
-                    if item.part_num == self.part_num.text().strip()
-                ]
-        ):
+        if part_num.strip() in self.app.items_by_part_num:
             QMessageBox.warning(
                 self,
                 'Item Already Exists Error',
-                f'"{new_item.part_num}" Already Exists In The Database, '
+                f'"{part_num}" Already Exists In The Database, '
                 'Please Make A New Item That Does Not Already Exist.'
             )
             return False
@@ -187,7 +194,7 @@ class Add(AbstractController):
         response = QMessageBox.question(
             self,
             'Item Creation Confirmation',
-            f'Are You Sure You Want To Add {new_item.part_num} '
+            f'Are You Sure You Want To Add {part_num} '
             'To The Database?\n\nThis Item Can Be Removed Later.',
             QMessageBox.Yes,
             QMessageBox.No
@@ -196,14 +203,29 @@ class Add(AbstractController):
         if response == QMessageBox.No:
             return True
 
+        b750, b757, min_750, min_757 = self._spinner_values
+        new_item = stock_manager.model.Item(
+            part_num,
+            self.manufacturer.text(),
+            self.desc.toPlainText(),
+            self._total,
+            b750,
+            b757,
+            min_750,
+            self._excess,
+            min_757
+        )
+        if not self.database.update_items_database(
+            stock_manager.utils.DatabaseUpdateType.ADD, new_item
+        ):
+            return False
+
         self.app.all_items.append(new_item)
+        self.app.items_by_part_num[new_item.part_num] = new_item
         self.logger.info(
             f'{self.app.user} Added Item To Database: {new_item.part_num}'
         )
         self.app.update_tables()
-        self.database.update_items_database(
-            stock_manager.utils.DatabaseUpdateType.ADD, new_item
-        )
         self._clear_form()
 
         self.app.finish.set_text(
@@ -10,11 +10,12 @@ to the database.
 
 from typing import TYPE_CHECKING, Union
 
-from PyQt5.QtCore import QModelIndex
+from PyQt5.QtCore import QModelIndex, pyqtSlot
 from PyQt5.QtWidgets import QLineEdit, QMessageBox, QSpinBox, QTextEdit
 
 import stock_manager
 from stock_manager.controllers import AbstractController
+from stock_manager.controllers._icons import icon
 from stock_manager.model import Item
 
 if TYPE_CHECKING:
@@ -29,6 +30,8 @@ class Edit(AbstractController):
     and updating the database.
     """
 
+    REQUIRED_WIDGETS = ('table', 'search')
+
     def __init__(self, app: 'App'):
         """
         Initialize the Edit page controller.
@@ -41,17 +44,22 @@ class Edit(AbstractController):
         self.PAGE_NAME = page
 
         self._selected_item: Union[Item, None] = None
+        # position of `_selected_item` in `app.all_items` when selected
+        self._selected_row = -1
         self._total = self._excess = 0
-        self._spinners: list[QSpinBox] = [
+        # bound once, they are called on every spinner change
+        self._total_equation = stock_manager.utils.total_equation
+        self._excess_equation = stock_manager.utils.excess_equation
+        self._spinners: tuple[QSpinBox, ...] = (
             self.b750_spinner,
             self.b757_spinner,
             self.min_750_spinner,
             self.min_757_spinner
-        ]
-        self._text_fields: list[Union[QLineEdit, QTextEdit]] = [
+        )
+        self._text_fields: tuple[Union[QLineEdit, QTextEdit], ...] = (
             self.manufacturer,
             self.desc
-        ]
+        )
 
         self.handle_connections()
 
@@ -62,15 +70,16 @@ class Edit(AbstractController):
         self.clear_btn.clicked.connect(self._clear_form)
         self.submit_btn.clicked.connect(self._submit_form)
 
+        on_spinner_change = self._on_spinner_change
         for spinner in self._spinners:
-            spinner.valueChanged.connect(self._on_spinner_change)
+            spinner.valueChanged.connect(on_spinner_change)
 
         self.search_icon.setIcon(qta.icon('fa5s.search'))
 
         qta.set_defaults(color='white')
 
-        self.clear_btn.setIcon(qta.icon('fa5s.backspace'))
-        self.submit_btn.setIcon(qta.icon('fa5s.plus-square'))
+        self.clear_btn.setIcon(icon('fa5s.backspace'))
+        self.submit_btn.setIcon(icon('fa5s.plus-square'))
 
     @staticmethod
     def _parse_field(text: str) -> Union[int, str, None]:
@@ -88,6 +97,7 @@ class Edit(AbstractController):
             return int(text)
         return text
 
+    @pyqtSlot(QModelIndex)
     def _on_cell_clicked(self, index: QModelIndex) -> None:
         """
         Populate the edit form fields with data from the selected
@@ -96,9 +106,10 @@ class Edit(AbstractController):
         :param index: The index of the clicked table cell as a `QModelIndex`.
         """
 
-        row = index.row()
+        row = self._source_row(index)
 
         self._selected_item = item = self.app.all_items[row]
+        self._selected_row = row
         self._total = item.total
         self._excess = item.excess
 
@@ -106,27 +117,18 @@ class Edit(AbstractController):
             self.part_num.setText(str(item.part_num))
             self.manufacturer.setText(item.manufacturer)
             self.desc.setText(item.description)
-            self.total_lbl.setText('Total: ' + str(self._total))
-            self.excess_lbl.setText('Excess: ' + str(self._excess))
-            self.b750_spinner.setValue(
-                item.stock_b750
-                if item.stock_b750 is not None
-                else 0
-            )
-            self.b757_spinner.setValue(
-                item.stock_b757
-                if item.stock_b757 is not None
-                else 0
-            )
-            self.min_750_spinner.setValue(
-                item.minimum
-                if item.minimum is not None
-                else 0
-            )
-            self.min_757_spinner.setValue(
-                item.minimum_sallie if item.minimum_sallie is not None
-                else 0
-            )
+            # `_spinners` order, empty counts show as 0
+            for spinner, value in zip(self._spinners, (
+                    item.stock_b750,
+                    item.stock_b757,
+                    item.minimum,
+                    item.minimum_sallie
+            )):
+                # recomputed once below instead of once per spinner
+                spinner.blockSignals(True)
+                spinner.setValue(value or 0)
+                spinner.blockSignals(False)
+            self._on_spinner_change(0)
         except Exception as e:
             self.logger.error(f'Failed To Populate Fields: {e}')
             QMessageBox.critical(
@@ -135,6 +137,7 @@ class Edit(AbstractController):
                 'Failed To Populate Fields'
             )
 
+    @pyqtSlot(int)
     def _on_spinner_change(self, _) -> None:
         """
         Update the total and excess labels when any spinner value changes.
@@ -143,18 +146,18 @@ class Edit(AbstractController):
         """
 
         try:
-            self._total = stock_manager.utils.total_equation(
+            self._total = self._total_equation(
                 self.b750_spinner.value(),
                 self.b757_spinner.value()
             )
-            self._excess = stock_manager.utils.excess_equation(
+            self._excess = self._excess_equation(
                 self._total,
                 self.min_750_spinner.value(),
                 self.min_757_spinner.value()
             )
 
-            self.total_lbl.setText('Total: ' + str(self._total))
-            self.excess_lbl.setText('Excess: ' + str(self._excess))
+            self.total_lbl.setText(f'Total: {self._total}')
+            self.excess_lbl.setText(f'Excess: {self._excess}')
         except Exception as e:
             self.logger.error(f'Spinner Change Error: {e}')
             QMessageBox.critical(
@@ -163,6 +166,7 @@ class Edit(AbstractController):
                 'Failed To Compute Spinner Data'
             )
 
+    @pyqtSlot()
     def _clear_form(self) -> None:
         """Clear all fields in the edit form and reset spinners and labels."""
 
@@ -178,8 +182,10 @@ class Edit(AbstractController):
             spinner.setValue(0)
 
         self._selected_item = None
+        self._selected_row = -1
         self._total = self._excess = 0
 
+    @pyqtSlot()
     def _submit_form(self) -> None:
         """
         Validate form data, update the selected item if it has changed,
@@ -234,10 +240,27 @@ class Edit(AbstractController):
         if response == QMessageBox.No:
             return
 
-        for i, old_item in enumerate(self.app.all_items):
-            if old_item.part_num == new_item.part_num:
-                self.app.all_items[i] = new_item
-                break
+        items = self.app.all_items
+        row = self._selected_row
+        if not 0 <= row < len(items) or items[row] is not self._selected_item:
+            # items were added or removed since this one was selected, find
+            # it by identity, equal values may belong to another item
+            row = next((
+                i for i, item in enumerate(items)
+                if item is self._selected_item
+            ), -1)
+            if row < 0:
+                QMessageBox.warning(
+                    self,
+                    'Item No Longer Exists',
+                    f'{new_item.part_num} Was Removed From The Database '
+                    'Since It Was Selected'
+                )
+                self._clear_form()
+                return
+        items[row] = new_item
+        self.app.items_by_part_num.pop(self._selected_item.part_num, None)
+        self.app.items_by_part_num[new_item.part_num] = new_item
 
         self.logger.info(
             f'{self.app.user} Edited Database Item: {new_item.part_num}'
@@ -4,7 +4,7 @@ in the Stock Management Application."""
 from typing import TYPE_CHECKING, Union
 
 import numpy
-from PyQt5.QtCore import QModelIndex
+from PyQt5.QtCore import QModelIndex, pyqtSlot
 from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtWidgets import QMessageBox
 from qrcode.image.pil import PilImage
@@ -38,12 +38,8 @@ class Export(AbstractExporter):
         self.handle_connections()
 
     def handle_connections(self) -> None:
-        self.back_btn.clicked.connect(
-            lambda: self.app.view.to_page()
-        )  # keep as lambda because of connect()
-        self.location_btn.clicked.connect(
-            lambda: self.get_directory(self.location_btn)
-        )
+        self.back_btn.clicked.connect(self.app.view.to_page)
+        self.location_btn.clicked.connect(self._choose_location)
         self.export_btn.clicked.connect(self.export)
 
         def handle_icons():
@@ -60,6 +56,7 @@ class Export(AbstractExporter):
 
         handle_icons()
 
+    @pyqtSlot()
     def export(self) -> bool:
         try:
             from stock_manager.utils import ExportTypes
@@ -108,6 +105,8 @@ class QRGenerate(AbstractExporter):
     Handles generating and exporting QR codes associated with inventory items.
     """
 
+    REQUIRED_WIDGETS = ('location_btn', 'table', 'search')
+
     def __init__(self, app: 'App'):
         """
         Initialize the QRGenerate controller.
@@ -126,15 +125,14 @@ class QRGenerate(AbstractExporter):
         import qtawesome as qta
 
         self.table.clicked.connect(self._on_cell_clicked)
-        self.location_btn.clicked.connect(
-            lambda: self.get_directory(self.location_btn)
-        )
+        self.location_btn.clicked.connect(self._choose_location)
         self.save_btn.clicked.connect(self.export)
 
         self.search_icon.setIcon(qta.icon('fa5s.search'))
         self.location_btn.setIcon(qta.icon('fa6s.folder-tree'))
         self.save_btn.setIcon(qta.icon('fa5s.download'))
 
+    @pyqtSlot()
     def export(self) -> bool:
         if not self._selected_qr:
             QMessageBox.warning(
@@ -158,6 +156,7 @@ class QRGenerate(AbstractExporter):
         else:
             return True
 
+    @pyqtSlot(QModelIndex)
     def _on_cell_clicked(self, index: QModelIndex) -> None:
         """
         Generates and displays a QR code corresponding
@@ -166,7 +165,7 @@ class QRGenerate(AbstractExporter):
         :param index: The index of the clicked table cell as a `QModelIndex`.
         """
 
-        row = index.row()
+        row = self._source_row(index)
         item = self.app.all_items[row]
 
         try:
@@ -40,9 +40,7 @@ class Finish(AbstractController):
     def handle_connections(self) -> None:
         import qtawesome as qta
 
-        self.pushButton.clicked.connect(
-            lambda: self.app.view.to_page()
-        )  # keep as lambda because of connect()
+        self.pushButton.clicked.connect(self.app.view.to_page)
         self.pushButton.setIcon(qta.icon('fa5s.table', color='white'))
 
     def set_text(self, title_txt: str) -> None:
@@ -26,6 +26,8 @@ class Remove(AbstractController):
     from the database.
     """
 
+    REQUIRED_WIDGETS = ('table', 'search')
+
     def __init__(self, app: 'App'):
         """
         Initialize the Remove page.
@@ -53,7 +55,7 @@ class Remove(AbstractController):
         :param index: The index of the clicked table cell as a `QModelIndex`.
         """
 
-        row = index.row()
+        row = self._source_row(index)
         selected_item = self.app.all_items[row]
 
         response = QMessageBox.question(
@@ -67,6 +69,7 @@ class Remove(AbstractController):
 
         if response == QMessageBox.Yes:
             self.app.all_items.remove(selected_item)
+            self.app.items_by_part_num.pop(selected_item.part_num, None)
             self.logger.info(
                 f'{self.app.user} Removed Item From Database: '
                 f'{selected_item.part_num}'
@@ -9,11 +9,8 @@ parts of the application.
 
 from typing import TYPE_CHECKING
 
-import cv2
 import qtawesome as qta
-from numpy import ndarray
 from PyQt5.QtWidgets import QMessageBox
-from qasync import asyncSlot
 
 import stock_manager
 
@@ -52,34 +49,28 @@ class ItemScanner(AbstractScanner):
         self.clear_btn.setIcon(qta.icon('fa5s.backspace'))
         self.done_btn.setIcon(qta.icon('fa5s.check-square'))
 
-    @asyncSlot()
-    async def check_for_qr(self, frame: ndarray) -> bool:
+    def check_for_qr(self, data: str) -> bool:
         """
-        Scans the current frame for an item QR code, adding it to an
-        internal list to be used when submitting a form and updating the UI.
+        Handles a scanned item QR code, adding it to an internal
+        list to be used when submitting a form and updating the UI.
 
-        :param frame: Current video frame as a numpy ndarray.
+        :param data: Text decoded from the QR code.
         :return: True if the QR code scanned is successfully added to the
         scanned items list or is already in the scanned items list, False
-        if no QR code is detected or if the scanned QR code is not recognized
-        in the database.
+        if the scanned QR code is not recognized in the database.
         """
 
-        data, _, _ = cv2.QRCodeDetector().detectAndDecode(frame)
-        if not data:
-            return False
-
-        if data in [item.part_num for item in self._items]:
+        if any(item.part_num == data for item in self._items):
             return True
 
         self.logger.info(f'{self.app.user} Scanned Item QR Code: {data}')
 
-        for item in self.app.all_items:
-            if data == item.part_num:
-                self._items.append(item)
-                self.logger.info(f'{self.app.user} Added {data} To Items List')
-                self.items_list.append(f'<ul><li>{data}</li></ul>')
-                return True
+        item = self.app.items_by_part_num.get(data)
+        if item is not None:
+            self._items.append(item)
+            self.logger.info(f'{self.app.user} Added {data} To Items List')
+            self.items_list.append(f'<ul><li>{data}</li></ul>')
+            return True
 
         self.logger.warning(f'Item QR Code Not Recognized: "{data}"')
         QMessageBox.warning(
@@ -128,27 +119,26 @@ class ItemScanner(AbstractScanner):
 
         try:
             for _item in self._items:
-                for item in self.app.all_items:
-                    if not _item == item:
-                        continue
-
-                    if self.b750_btn.isChecked():
-                        item.stock_b750 -= 1
-                    elif self.b757_btn.isChecked():
-                        item.stock_b757 -= 1
-                    else:
-                        self.logger.warning('Neither Radio Button Is Selected')
-                        QMessageBox.warning(
-                            self,
-                            'Radio Button Error',
-                            'Neither Radio Button Is Selected, '
-                            'Please Select A Radio Button '
-                            'Before Submitting Form'
-                        )
-                        return
-
-                    item.update_stats()
-                    break
+                item = self.app.items_by_part_num.get(_item.part_num)
+                if item is None or not _item == item:
+                    continue
+
+                if self.b750_btn.isChecked():
+                    item.stock_b750 -= 1
+                elif self.b757_btn.isChecked():
+                    item.stock_b757 -= 1
+                else:
+                    self.logger.warning('Neither Radio Button Is Selected')
+                    QMessageBox.warning(
+                        self,
+                        'Radio Button Error',
+                        'Neither Radio Button Is Selected, '
+                        'Please Select A Radio Button '
+                        'Before Submitting Form'
+                    )
+                    return
+
+                item.update_stats()
 
             self.app.update_tables()
             self.database.update_items_database(
@@ -216,19 +206,17 @@ class Login(AbstractScanner):
             self.app.user = ''
         super().to_page()
 
-    @asyncSlot()
-    async def check_for_qr(self, frame: ndarray) -> bool:
+    def check_for_qr(self, data: str) -> bool:
         """
-        Scans the current frame for a user QR code, logging them in if valid.
+        Handles a scanned user QR code, logging them in if valid.
 
-        :param frame: Current video frame as a numpy ndarray.
+        :param data: Text decoded from the QR code.
         :return: True if the QR code scanned is valid and the user can
-        be logged in, False if no QR code is detected or if the scanned
-        QR code is not recognized in the database.
+        be logged in, False if a user is already logged in or if the
+        scanned QR code is not recognized in the database.
         """
 
-        data, _, _ = cv2.QRCodeDetector().detectAndDecode(frame)
-        if not data or self.app.user:
+        if self.app.user:
             return False
 
         self.logger.info(f'QR Code Scanned: {data}')
@@ -23,6 +23,8 @@ class View(AbstractController):
     navigation to `export.ui` and `export.py`.
     """
 
+    REQUIRED_WIDGETS = ('table', 'search')
+
     def __init__(self, app: 'App'):
         """
         Controller for the 'View' page of the stock management application.
@@ -38,9 +40,15 @@ class View(AbstractController):
     def handle_connections(self) -> None:
         import qtawesome as qta
 
-        self.export_btn.clicked.connect(
-            lambda: self.app.export.to_page()
-        )  # keep as lambda because of connect()
+        self.export_btn.clicked.connect(self._open_export)
 
         self.export_btn.setIcon(qta.icon('fa5s.file-export', color='white'))
         self.search_icon.setIcon(qta.icon('fa5s.search'))
+
+    def _open_export(self) -> None:
+        """
+        Navigates to the export page, looked up on click
+        since it is created after this page.
+        """
+
+        self.app.export.to_page()
@@ -8,10 +8,9 @@ part numbers, quantities, and stock statistics.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Iterator, Optional, Union
+from typing import Iterator, Optional, Union
 
-if TYPE_CHECKING:
-    from stock_manager.utils import StockStatus
+from stock_manager.utils import StockStatus, excess_equation, total_equation
 
 
 @dataclass
@@ -41,7 +40,7 @@ class Item:
     minimum: Optional[int]
     excess: Optional[int]
     minimum_sallie: Optional[int]
-    stock_status: Optional['StockStatus'] = None
+    stock_status: Optional[StockStatus] = None
 
     def __post_init__(self):
         self._calc_stock_status()
@@ -136,8 +135,6 @@ class Item:
         fields based on current stock and minimums.
         """
 
-        from stock_manager.utils import excess_equation, total_equation
-
         total = total_equation(self.stock_b750, self.stock_b757)
         self.total = 0 if total <= 0 else total
 
@@ -151,8 +148,6 @@ class Item:
         string value of a `StockStatus` enum based on `self.excess`.
         """
 
-        from stock_manager.utils import StockStatus
-
         if self.excess is None or self.total is None:
             return
 
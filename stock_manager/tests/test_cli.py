@@ -1,5 +1,7 @@
 import logging
 import os
+import subprocess
+import sys
 
 from pytest import mark, raises
 
@@ -33,6 +35,26 @@ def test_version(monkeypatch, capsys, version_command: str):
     assert captured.out.strip() == stock_manager.__version__
 
 
+def test_version_skips_heavy_imports():
+    code = (
+        'import sys\n'
+        'sys.argv = ["stock_manager", "--version"]\n'
+        'from stock_manager.__main__ import main\n'
+        'try:\n'
+        '    main()\n'
+        'except SystemExit:\n'
+        '    pass\n'
+        'heavy = ("PyQt5", "gspread", "mysql", "qrcode", "pytest")\n'
+        'print("loaded:", *(name for name in heavy if name in sys.modules))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.strip().splitlines()[-1].split()[1:]
+    assert not loaded, f'Unexpected modules loaded for --version: {loaded}'
+
+
 def test_sync(monkeypatch, caplog):
     caplog.set_level(logging.INFO)
     monkeypatch.setattr('sys.argv', ['stock_manager', 'sync'])
@@ -157,6 +179,22 @@ def test_add_edit_remove_item(monkeypatch, caplog):
         f'Expected success message not found in logs: {caplog.text}'
 
 
+def test_add_item_value_count(monkeypatch, caplog):
+    monkeypatch.setattr(
+        'sys.argv',
+        [
+            'stock_manager',
+            'items',
+            'add',
+            *TEST_ITEM,
+            TEST_ITEM.part_num
+        ]
+    )
+    main()
+    assert 'Expected 10 Values Per Item' in caplog.text, \
+        f'Expected error message not found in logs: {caplog.text}'
+
+
 def test_add_remove_user(monkeypatch, caplog):
     caplog.set_level(logging.INFO)
     monkeypatch.setattr(
@@ -1,4 +1,5 @@
 import os.path
+from dataclasses import replace
 from typing import Union
 from unittest.mock import MagicMock
 
@@ -8,7 +9,7 @@ from numpy import ndarray
 from PyQt5.QtCore import QAbstractItemModel, QModelIndex, QRect, Qt
 from PyQt5.QtWidgets import (QFileDialog, QLineEdit, QMessageBox, QTableView,
                              QTextEdit)
-from pytest import fixture, mark, skip
+from pytest import fixture, mark, raises, skip
 from pytestqt.qtbot import QtBot
 
 import stock_manager
@@ -16,6 +17,7 @@ from stock_manager.app import App
 from stock_manager.controllers import (AbstractController, AbstractScanner,
                                        Add, Edit, Export, Finish, ItemScanner,
                                        Login, QRGenerate, Remove, View)
+from stock_manager.controllers._icons import icon
 from stock_manager.model import Item
 from stock_manager.utils import DBUtils, ExportUtils
 
@@ -63,6 +65,16 @@ class TestControllers:
         assert await table_controller.update_table() \
                and table_controller.table.model()
 
+    @mark.asyncio
+    async def test_update_table_appended(self, qtbot: QtBot, table_controller):
+        qtbot.addWidget(table_controller)
+        table_controller.app.all_items = [TEST_ITEM]
+        assert await table_controller.update_table()
+
+        table_controller.app.all_items.append(TEST_ITEM)
+        assert await table_controller.update_table()
+        assert table_controller.table.model().rowCount() == 2
+
     def test_to_page(self, qtbot: QtBot, controller):
         if isinstance(controller, AbstractScanner):
             skip(
@@ -73,6 +85,18 @@ class TestControllers:
         controller.to_page()
 
 
+def test_icon_cached(qtbot: QtBot):
+    assert icon('fa5s.search') is icon('fa5s.search')
+
+
+def test_required_widgets_checked(qtbot: QtBot):
+    class MissingTable(Finish):
+        REQUIRED_WIDGETS = ('table',)
+
+    with raises(AttributeError, match='table'):
+        MissingTable(MagicMock())
+
+
 @mark.skip(
     reason='Raises Warnings But No Errors, Clutters All Useful Information'
 )
@@ -103,7 +127,8 @@ class TestScanners:
     def test_qr_checking(self, qtbot: QtBot, scanner, file_num: str):
         qtbot.addWidget(scanner)
         image: ndarray = cv2.imread(f'./exports/test_image{file_num}.jpeg')
-        assert image.any() and scanner.check_for_qr(image)
+        data, _, _ = cv2.QRCodeDetector().detectAndDecode(image)
+        assert image.any() and scanner.check_for_qr(data)
 
 
 @mark.parametrize('controller', [Export, QRGenerate])
@@ -148,6 +173,7 @@ class TestAdd:
 
         controller.b750_spinner.setValue(add_clicks)
         controller.min_750_spinner.setValue(sub_clicks)
+        qtbot.waitUntil(lambda: not controller._recompute_timer.isActive())
 
         total = stock_manager.utils.total_equation(add_clicks, 0)
         excess = stock_manager.utils.excess_equation(total, sub_clicks, 0)
@@ -245,6 +271,30 @@ class TestEdit:
         qtbot.addWidget(controller)
         assert controller._parse_field(text) == expected
 
+    @mark.asyncio
+    async def test_clicked_filtered_item(self, qtbot: QtBot, controller):
+        other = replace(TEST_ITEM, part_num='other_item')
+        controller.app.all_items = [TEST_ITEM, other]
+        qtbot.addWidget(controller)
+
+        assert await controller.update_table()
+        controller._proxy_model.set_filter_text(other.part_num)
+        handle_table_click(qtbot, controller.table)
+
+        assert controller._selected_item is other
+
+    @mark.asyncio
+    async def test_clicked_sorted_item(self, qtbot: QtBot, controller):
+        other = replace(TEST_ITEM, part_num='zzz_item')
+        controller.app.all_items = [TEST_ITEM, other]
+        qtbot.addWidget(controller)
+
+        assert await controller.update_table()
+        controller.table.sortByColumn(0, Qt.DescendingOrder)
+        handle_table_click(qtbot, controller.table)
+
+        assert controller._selected_item is other
+
     @mark.asyncio
     async def test_clicked_item(self, qtbot: QtBot, controller):
         qtbot.addWidget(controller)
@@ -428,6 +478,7 @@ class TestItemScanner:
 
         TEST_ITEM.stock_b750 += 1
         controller.app.all_items = [TEST_ITEM]
+        controller.app.items_by_part_num = {TEST_ITEM.part_num: TEST_ITEM}
         controller._items = [TEST_ITEM]
 
         handle_alert(monkeypatch, 'question', QMessageBox.No)
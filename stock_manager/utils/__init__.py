@@ -2,13 +2,17 @@
 Utility package for Stock Management Application.
 
 Exposes Logger and DBUtils classes for logging and Google Sheets access.
+DBUtils and ExportUtils are imported on first access so that importing
+the package does not load the Google Sheets, MySQL, Qt and QR code
+dependencies.
 """
 
-from .constants import (GS_FILE_NAME, KEEP_HEADERS, SIDEBAR_BUTTON_SIZE,
-                        excess_equation, total_equation)
-from .database import DBUtils
+import importlib
+
+from .constants import (EXPORTS_DIR, GS_FILE_NAME, KEEP_HEADERS, ROOT_DIR,
+                        SIDEBAR_BUTTON_SIZE, UI_DIR, excess_equation,
+                        total_equation)
 from .enums import DatabaseUpdateType, ExportTypes, Hutches, Pages, StockStatus
-from .file_exports import ExportUtils
 from .logger import Logger
 
 __all__ = [
@@ -24,5 +28,45 @@ __all__ = [
     'excess_equation',
     'SIDEBAR_BUTTON_SIZE',
     'GS_FILE_NAME',
-    'KEEP_HEADERS'
+    'KEEP_HEADERS',
+    'ROOT_DIR',
+    'UI_DIR',
+    'EXPORTS_DIR'
 ]
+
+# Lazily exported name -> submodule that defines it.
+_LAZY = {
+    'DBUtils': 'database',
+    'ExportUtils': 'file_exports'
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports and caches a utility class the first time it is accessed.
+
+    :param name: Name of the utility class.
+    :return: The utility class.
+    :raises AttributeError: If `name` is not a lazily exported class.
+    """
+
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Lists loaded attributes along with every lazily exported class.
+
+    :return: Sorted attribute names.
+    """
+
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,8 @@ Defines fixed values used throughout the SLAC-LCLS-Stock-Management
 application to maintain consistency and simplify updates.
 """
 
+from pathlib import Path
+
 
 def total_equation(b750_stock: int, b757_stock: int) -> int:
     """
@@ -32,6 +34,10 @@ def excess_equation(total: int, b750_minimum: int, b757_minimum: int) -> int:
     return total - (b750_minimum + b757_minimum)
 
 
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+UI_DIR = ROOT_DIR / 'ui'
+EXPORTS_DIR = ROOT_DIR / 'exports'
+
 SIDEBAR_BUTTON_SIZE = 14
 GS_FILE_NAME = 'ECS Common Stock Inventory'
 KEEP_HEADERS = [
@@ -7,7 +7,6 @@ data from/to Google Sheets and a MySQL Database.
 
 import logging
 import os.path
-from pathlib import Path
 from typing import TYPE_CHECKING, Iterable, Union
 
 import gspread
@@ -36,9 +35,8 @@ class DBUtils:
         :raises SystemExit: If the database fails to load
         """
 
-        base_dir = Path(__file__).resolve().parent.parent.parent
         credentials_path = os.path.join(
-            base_dir, 'assets', 'gs_credentials.json'
+            stock_manager.utils.ROOT_DIR, 'assets', 'gs_credentials.json'
         )
 
         scope = [
@@ -390,7 +388,9 @@ class DBUtils:
         :param update_type: The type of database update as
         a `DatabaseUpdateType` enum (e.g. `ADD`, `EDIT`, `REMOVE`)
         :param changelist: An iterable list of items to repeat
-        the same process or a single item
+        the same process or a single item, written to the SQL database
+        in a single transaction. Google Sheet changes cannot be rolled
+        back, so a failure can leave the two databases out of sync.
         :return: `True` if process completed successfully, `False` otherwise
         """
 
@@ -414,40 +414,33 @@ class DBUtils:
             )
             return False
 
-        item: Item
-        for item in changelist:
-            update_gs: bool = self._update_items_gs(update_type, item)
+        update_gs: bool = self._update_items_gs(update_type, changelist)
 
-            if self.sql_database:
-                update_sql: bool = self._update_items_sql(update_type, item)
-                if not all([update_gs, update_sql]):
-                    return False
-            elif not update_gs:
-                return False
-        return True
+        if self.sql_database:
+            update_sql: bool = self._update_items_sql(update_type, changelist)
+            return update_gs and update_sql
+        return update_gs
 
     def _update_items_sql(
         self,
         update_type: 'DatabaseUpdateType',
-        item: 'Item'
+        items: Union[list['Item'], 'Item']
     ) -> bool:
         """
-        Updates the SQL database for an inventory item based on
-        the specified update type.
+        Updates the SQL database for one or more inventory items based on
+        the specified update type, committing once for all of them.
 
         :param update_type: Type of update operation (ADD, EDIT, REMOVE).
-        :param item: The item object to insert, update, or delete.
+        :param items: The item object, or list of item objects,
+        to insert, update, or delete.
         :return: `True` if the operation was successful, `False` otherwise.
         """
 
         from stock_manager.utils import DatabaseUpdateType
 
-        vals: list[Union[str, int, None]] = [
-            value
-            if not value == ''
-            else None for
-            value in item
-        ]
+        if not isinstance(items, list):
+            items = [items]
+
         sql = ''
         match update_type:
             case DatabaseUpdateType.ADD:
@@ -462,7 +455,6 @@ class DBUtils:
                        'stock_b750 = %s, stock_b757 = %s, minimum = %s, '
                        'excess = %s, minimum_sallie = %s, stock_status = %s '
                        'where part_num = %s;')
-                vals = vals[1:] + [item.part_num]
             case DatabaseUpdateType.REMOVE:
                 sql = ('delete from inventory_items '
                        'where part_num = %s and manufacturer = %s and '
@@ -470,12 +462,32 @@ class DBUtils:
                        'and stock_b757 = %s and minimum = %s and excess = %s '
                        'and minimum_sallie = %s and stock_status = %s;')
 
+        all_vals: list[list[Union[str, int, None]]] = []
+        for item in items:
+            vals: list[Union[str, int, None]] = [
+                value
+                if not value == ''
+                else None for
+                value in item
+            ]
+            if update_type == DatabaseUpdateType.EDIT:
+                vals = vals[1:] + [item.part_num]
+            all_vals.append(vals)
+
         try:
-            self._cursor.execute(sql, vals)
+            self._cursor.executemany(sql, all_vals)
             self._db.commit()
             return True
         except Exception as e:
             self._log.error(f'Error Updating Items SQL Database: {e}')
+            # otherwise the rows written before the error would be
+            # committed along with the next, unrelated, update
+            try:
+                self._db.rollback()
+            except Exception as rollback_error:
+                self._log.error(
+                    f'Error Rolling Back Items SQL Database: {rollback_error}'
+                )
             QMessageBox.critical(
                 None,
                 'Items SQL Database Update Error',
@@ -486,40 +498,56 @@ class DBUtils:
     def _update_items_gs(
         self,
         update_type: 'DatabaseUpdateType',
-        item: 'Item'
+        items: Union[list['Item'], 'Item']
     ) -> bool:
         """
-        Updates the Google Sheets database for an inventory item.
+        Updates the Google Sheets database for one or more inventory items.
+
+        Added items are appended, and edited items' rows
+        rewritten, in a single request.
 
         :param update_type: Type of update operation (ADD, EDIT, REMOVE).
-        :param item: The item object to append, update, or delete.
+        :param items: The item object, or list of item objects,
+        to append, update, or delete.
         :return: `True` if the operation was successful, `False` otherwise.
         """
 
         from stock_manager.utils import DatabaseUpdateType
 
+        if not isinstance(items, list):
+            items = [items]
+
         sheet: Worksheet = self._client.worksheet('Master Part List')
         try:
             match update_type:
                 case DatabaseUpdateType.ADD:
-                    sheet.append_row([value for value in item])
+                    sheet.append_rows([list(item) for item in items])
                 case DatabaseUpdateType.EDIT:
-                    cell: Union[Cell, None] = sheet.find(item.part_num)
-                    if not cell:
-                        return False
-
-                    i: int
-                    value: Union[str, int, None]
-                    for i, value in enumerate(item):
-                        sheet.update_cell(cell.row, i + 1, value)
+                    cells: list[Cell] = []
+                    for item in items:
+                        cell: Union[Cell, None] = sheet.find(item.part_num)
+                        if not cell:
+                            return False
+
+                        cells.extend(
+                            Cell(cell.row, i + 1, value)
+                            for i, value in enumerate(item)
+                        )
+                    # one request for every edited cell, entered as if
+                    # typed like `update_cell` does
+                    sheet.update_cells(
+                        cells, value_input_option='USER_ENTERED'
+                    )
                 case DatabaseUpdateType.REMOVE:
-                    cell: Union[Cell, None] = sheet.find(item.part_num)
-                    if cell:
-                        sheet.delete_rows(cell.row)
+                    for item in items:
+                        cell: Union[Cell, None] = sheet.find(item.part_num)
+                        if cell:
+                            sheet.delete_rows(cell.row)
             return True
         except Exception as e:
+            part_nums = ', '.join(str(item.part_num) for item in items)
             self._log.error(
-                f'Error Updating Item "{item.part_num}" '
+                f'Error Updating Item "{part_nums}" '
                 f'In Google Sheet Database: {e}'
             )
             QMessageBox.critical(
@@ -562,7 +590,7 @@ class DBUtils:
 
         if self.sql_database:
             update_sql: bool = self._update_users_sql(update_type, username)
-            return all([update_gs, update_sql])
+            return update_gs and update_sql
         return update_gs
 
     def _update_users_sql(